@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-import argparse
-import json
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
 
 def _build_sample_character() -> Dict[str, Any]:
     """Return a ready-to-use sample character payload.
@@ -119,23 +123,39 @@ def _build_sample_character() -> Dict[str, Any]:
 
 
 def _save_character(payload: Dict[str, Any], destination: Path) -> None:
+    if orjson is not None:
+        destination.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    import json
+
     destination.write_text(json.dumps(payload, indent=2) + "\n")
 
 
-def main() -> None:
+def _output_path() -> Path:
+    default = Path("sample_character.json")
+    if len(sys.argv) <= 1:
+        # Nothing to parse, so don't pay for importing and building argparse.
+        return default
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Generate a sample character sheet.")
     parser.add_argument(
         "--output",
         type=Path,
-        default=Path("sample_character.json"),
+        default=default,
         help="Where to write the sample JSON file (default: sample_character.json).",
     )
-    args = parser.parse_args()
+    return parser.parse_args().output
+
+
+def main() -> None:
+    output = _output_path()
 
     character = _build_sample_character()
-    _save_character(character, args.output)
+    _save_character(character, output)
 
-    print(f"Sample character written to {args.output}.")
+    print(f"Sample character written to {output}.")
     print("Actions available:")
     for action in character["actions"]:
         print(f" - {action['name']} ({action['type']}): {action['description']}")
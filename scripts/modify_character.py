@@ -5,17 +5,31 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
 
 CharacterPayload = Dict[str, Any]
 
 
 def _load(path: Path) -> CharacterPayload:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(path.read_text())
 
 
 def _save(data: CharacterPayload, path: Path) -> None:
-    path.write_text(json.dumps(data, indent=2) + "\n")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        return
+    # json.dump streams the encoder's chunks into the file buffer rather than
+    # building the whole document as one string first.
+    with path.open("w") as handle:
+        json.dump(data, handle, indent=2)
+        handle.write("\n")
 
 
 def _ensure_xp_available(data: CharacterPayload) -> None:
@@ -25,29 +39,53 @@ def _ensure_xp_available(data: CharacterPayload) -> None:
     xp_block["available"] = total - spent
 
 
-def _set_skill(data: CharacterPayload, spec: str) -> None:
-    if "=" not in spec:
+def _skill_index(data: CharacterPayload) -> Dict[str, Dict[str, Any]]:
+    """Map lower-cased skill names to their entries so updates avoid a linear scan."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for skill in data.setdefault("skills", []):
+        # Keep the first entry on duplicates, matching the old linear search.
+        index.setdefault(skill.get("name", "").lower(), skill)
+    return index
+
+
+def _parse_skill_spec(spec: str) -> tuple[str, str, str]:
+    """Split 'Skill Name=Status' into ``(name, lower-cased name, status)``."""
+    name, sep, status = spec.partition("=")
+    if not sep:
         raise ValueError("Skill specification must look like 'Skill Name=Status'.")
-    name, status = [part.strip() for part in spec.split("=", 1)]
+    name, status = name.strip(), status.strip()
     if not name:
         raise ValueError("Skill name cannot be empty.")
     if not status:
         raise ValueError("Skill status cannot be empty.")
+    return name, name.lower(), status
 
-    skills: List[Dict[str, Any]] = data.setdefault("skills", [])
-    for skill in skills:
-        if skill.get("name", "").lower() == name.lower():
-            skill["status"] = status
-            break
-    else:
-        skills.append({"name": name, "status": status})
 
-
-def _remove_action(data: CharacterPayload, name: str) -> bool:
-    actions: List[Dict[str, Any]] = data.get("actions", [])
-    original_len = len(actions)
-    data["actions"] = [action for action in actions if action.get("name", "").lower() != name.lower()]
-    return len(data["actions"]) != original_len
+def _set_skill(
+    data: CharacterPayload, name: str, key: str, status: str, index: Dict[str, Dict[str, Any]]
+) -> None:
+    skill = index.get(key)
+    if skill is not None:
+        skill["status"] = status
+    else:
+        skill = {"name": name, "status": status}
+        data.setdefault("skills", []).append(skill)
+        index[key] = skill
+
+
+def _remove_actions(data: CharacterPayload, names: List[str]) -> set[str]:
+    """Drop every action named in ``names`` and return the lower-cased names that matched."""
+    targets = {name.lower() for name in names}
+    kept: List[Dict[str, Any]] = []
+    removed: set[str] = set()
+    for action in data.get("actions", []):
+        key = action.get("name", "").lower()
+        if key in targets:
+            removed.add(key)
+        else:
+            kept.append(action)
+    data["actions"] = kept
+    return removed
 
 
 def _add_action(data: CharacterPayload, spec: str) -> None:
@@ -72,12 +110,18 @@ def _add_action(data: CharacterPayload, spec: str) -> None:
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Modify a generated character JSON file.")
-    parser.add_argument("file", type=Path, help="Character JSON file to modify")
+    parser.add_argument("file", type=Path, help="Character JSON file (or directory with --batch) to modify")
     parser.add_argument(
         "--output",
         type=Path,
         help="Optional output path. If omitted the input file is modified in place.",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Treat FILE as a directory and apply the changes to every *.json file in it. "
+        "--output, if given, is the directory the modified files are written to.",
+    )
     parser.add_argument("--set-xp-total", type=int, help="Set the character's total XP")
     parser.add_argument("--set-xp-spent", type=int, help="Set the character's spent XP")
     parser.add_argument(
@@ -101,6 +145,35 @@ def build_parser() -> argparse.ArgumentParser:
         metavar="NAME",
         help="Remove an action by name (case-insensitive).",
     )
+    # Plural forms take many values after a single flag and share a destination
+    # with the singular flags, so both spellings can be mixed.
+    parser.add_argument(
+        "--set-skills",
+        dest="set_skill",
+        action="extend",
+        nargs="+",
+        default=[],
+        metavar="NAME=STATUS",
+        help="Update several skills at once, e.g. --set-skills 'Dodge=+10' 'Awareness=Trained'.",
+    )
+    parser.add_argument(
+        "--add-actions",
+        dest="add_action",
+        action="extend",
+        nargs="+",
+        default=[],
+        metavar="NAME|TYPE|DESCRIPTION[|keywords]",
+        help="Append several actions at once.",
+    )
+    parser.add_argument(
+        "--remove-actions",
+        dest="remove_action",
+        action="extend",
+        nargs="+",
+        default=[],
+        metavar="NAME",
+        help="Remove several actions by name at once.",
+    )
     return parser
 
 
@@ -114,17 +187,24 @@ def apply_changes(data: CharacterPayload, args: argparse.Namespace) -> List[str]
         data.setdefault("xp", {})["spent"] = args.set_xp_spent
         messages.append(f"XP spent set to {args.set_xp_spent}.")
 
-    for skill_spec in args.set_skill:
-        _set_skill(data, skill_spec)
-        messages.append(f"Skill updated: {skill_spec}.")
+    if args.set_skill:
+        specs = [_parse_skill_spec(skill_spec) for skill_spec in args.set_skill]
+        index = _skill_index(data)
+        for skill_spec, (name, key, status) in zip(args.set_skill, specs):
+            _set_skill(data, name, key, status, index)
+            messages.append(f"Skill updated: {skill_spec}.")
 
     for action_spec in args.add_action:
         _add_action(data, action_spec)
         messages.append(f"Action added: {action_spec.split('|', 1)[0].strip()}.")
 
+    removed = _remove_actions(data, args.remove_action) if args.remove_action else set()
     for name in args.remove_action:
-        removed = _remove_action(data, name)
-        if removed:
+        key = name.lower()
+        if key in removed:
+            # Report each removal once; repeats of a name then find nothing, as
+            # they would removing one name at a time.
+            removed.discard(key)
             messages.append(f"Action removed: {name}.")
         else:
             messages.append(f"No action named '{name}' found.")
@@ -133,19 +213,34 @@ def apply_changes(data: CharacterPayload, args: argparse.Namespace) -> List[str]
     return messages
 
 
-def main() -> None:
-    parser = build_parser()
-    args = parser.parse_args()
-
-    payload = _load(args.file)
+def _modify_file(path: Path, output_path: Path, args: argparse.Namespace) -> CharacterPayload:
+    payload = _load(path)
     messages = apply_changes(payload, args)
-
-    output_path = args.output or args.file
     _save(payload, output_path)
 
     print(f"Character saved to {output_path}.")
     for message in messages:
         print(f" - {message}")
+    return payload
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        # One process for the whole directory instead of one per character.
+        if not args.file.is_dir():
+            parser.error(f"--batch expects a directory, got '{args.file}'.")
+        if args.output is not None and args.output.exists() and not args.output.is_dir():
+            parser.error(f"--output must be a directory with --batch, got the file '{args.output}'.")
+        output_dir = args.output or args.file
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for path in sorted(args.file.glob("*.json")):
+            _modify_file(path, output_dir / path.name, args)
+        return
+
+    payload = _modify_file(args.file, args.output or args.file, args)
 
     print("Updated actions list:")
     for action in payload.get("actions", []):
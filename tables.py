@@ -5,6 +5,10 @@ from pathlib import Path
 INPUT_FILE = "core_all.txt"   # your big .txt
 OUTPUT_FILE = "core_tables.txt"    # where tables go
 
+# Hot per-line checks; match() is already anchored at the start of the string
+_TABLE_RE = re.compile(r'Table\s+\d').match
+_ASCII_DIGIT_RE = re.compile(r'[0-9]').search
+
 
 
 
@@ -16,7 +20,11 @@ def is_table_start(line: str) -> bool:
     'Table 7–23: Rending Critical Effects – Head'
     """
     stripped = line.strip()
-    return bool(re.match(r'^Table\s+\d', stripped))
+    # Nearly every line fails this cheap prefix test, so the regex only
+    # runs on actual 'Table ...' candidates.
+    if not stripped.startswith("Table"):
+        return False
+    return _TABLE_RE(stripped) is not None
 
 
 def is_row_start(line: str) -> bool:
@@ -28,63 +36,66 @@ def is_row_start(line: str) -> bool:
       '25+ metres 1d10+20'
       '1 The attack tears ...'
     """
-    stripped = line.lstrip()
-
     # Starts with a number (possibly with + or range markers)
     # 01–20, 41-70, 25+, 3, 10+, etc.
-    if re.match(r'^\d', stripped):
-        return True
-
-    return False
+    # Only the first character matters, so a str method beats the regex engine.
+    return line.lstrip()[:1].isdecimal()
 
 
 def contains_any_digit(line: str) -> bool:
+    # str.isdigit() also accepts characters like '²' that no regex digit class
+    # matches, so only ASCII lines take the regex shortcut.
+    if line.isascii():
+        return _ASCII_DIGIT_RE(line) is not None
     return any(ch.isdigit() for ch in line)
 
 
-def extract_tables_from_lines(lines):
-    tables = []
-    n = len(lines)
-    i = 0
+def iter_tables(line_iter):
+    """
+    Single pass over ``line_iter`` yielding each table as a string.
 
-    while i < n:
-        line = lines[i]
+    Only the block belonging to the table currently being collected is
+    buffered, so a file object can be passed in directly.
+    """
+    header = None  # None while seeking a header, otherwise collecting its block
+    # One buffer is reused for every table: _finish_table consumes it
+    # immediately and keeps no reference, so there is no per-table list.
+    block = []
+
+    for line in line_iter:
+        if is_table_start(line):
+            # A new header ends the block in progress (if any)
+            if header is not None:
+                yield _finish_table(header, block)
+            header = line.rstrip("\n")
+            block.clear()
+            continue
 
-        if not is_table_start(line):
-            i += 1
+        if header is None:
             continue
 
-        # We found a table header
-        current_table_lines = [line.rstrip("\n")]
-        i += 1
+        block.append(line.rstrip("\n"))
 
-        # Collect a coarse candidate block until:
-        # - next table header, OR
-        # - blank line, OR
-        # - EOF
-        block = []
-        while i < n:
-            next_line = lines[i]
-            # Stop if the next line starts a new table
-            if is_table_start(next_line):
-                break
+        # Stop if blank line (hard break in layout)
+        if not line.strip():
+            yield _finish_table(header, block)
+            header = None
 
-            # Stop if blank line (hard break in layout)
-            if not next_line.strip():
-                block.append(next_line.rstrip("\n"))
-                i += 1
-                break
+    if header is not None:
+        yield _finish_table(header, block)
 
-            block.append(next_line.rstrip("\n"))
-            i += 1
 
-        # Now refine this block using numeric / row heuristics
-        trimmed = trim_block_to_table(block)
+def _finish_table(header, block):
+    if not block:
+        # Reference-only header followed directly by another header or EOF:
+        # nothing to trim.
+        return header
+    # Refine the coarse block using numeric / row heuristics
+    return header + "\n" + "\n".join(trim_block_to_table(block))
 
-        current_table_lines.extend(trimmed)
-        tables.append("\n".join(current_table_lines))
 
-    return tables
+def extract_tables_from_lines(lines):
+    return list(iter_tables(lines))
 
 
 def trim_block_to_table(block_lines):
@@ -106,36 +117,21 @@ def trim_block_to_table(block_lines):
     # (In practice, this is mostly for 'Random Home World' where there
     #  is no blank line before prose.)
 
-    result = []
-    row_indices = []
-
     # Parameters: tweak to taste
     MIN_ROWS = 3
     MAX_NONROW_AFTER_LAST_ROW = 6  # how many non-row lines we tolerate after last real row
 
-    nonrow_since_last_row = 0
-    last_row_idx = -1
-
-    for idx, line in enumerate(block_lines):
-        stripped = line.strip()
-        result.append(line)
-
-        if is_row_start(stripped):
-            row_indices.append(idx)
-            last_row_idx = idx
-            nonrow_since_last_row = 0
-        else:
-            if last_row_idx != -1:
-                # We are after at least one row
-                # Count how many non-row lines we've seen since last row
-                nonrow_since_last_row += 1
-
-                # If we've seen enough rows AND too many non-row lines after the last row,
-                # we assume we've wandered into prose. Cut here.
-                if len(row_indices) >= MIN_ROWS and nonrow_since_last_row > MAX_NONROW_AFTER_LAST_ROW:
-                    # Drop everything from this line onward
-                    result = result[:idx]  # do not include current line
-                    break
+    # Classify every line in one pass, then only walk the gaps between rows
+    # instead of keeping per-line counters.
+    row_indices = [idx for idx, line in enumerate(block_lines) if is_row_start(line)]
+    next_rows = row_indices[MIN_ROWS:] + [len(block_lines)]
+
+    for last_row_idx, next_row_idx in zip(row_indices[MIN_ROWS - 1:], next_rows):
+        # If we've seen enough rows AND too many non-row lines after the last row,
+        # we assume we've wandered into prose. Cut at the first line past the limit.
+        cut = last_row_idx + MAX_NONROW_AFTER_LAST_ROW + 1
+        if cut < next_row_idx:
+            return block_lines[:cut]  # do not include the line at `cut`
 
     # If we never saw enough rows, it's probably either:
     # - a non-data "table" (like a one-line reference), or
@@ -143,9 +139,9 @@ def trim_block_to_table(block_lines):
     # In both cases, just return the whole block as-is.
     #
     # If we did see enough rows but never hit the non-row cutoff,
-    # we also just return `result` as collected.
+    # we also just return the block as collected.
 
-    return result
+    return list(block_lines)
 
 
 def main():
@@ -153,18 +149,18 @@ def main():
     if not text_path.exists():
         raise FileNotFoundError(f"Input file not found: {INPUT_FILE}")
 
-    with text_path.open("r", encoding="utf-8", errors="ignore") as f:
-        lines = f.readlines()
-
-    tables = extract_tables_from_lines(lines)
-
     out_path = Path(OUTPUT_FILE)
-    separator = "\n\n" + ("-" * 80) + "\n\n"
+    separator = ("\n\n" + ("-" * 80) + "\n\n").encode("utf-8")
 
-    with out_path.open("w", encoding="utf-8") as f:
-        f.write(separator.join(tables))
+    count = 0
+    with text_path.open("r", encoding="utf-8", errors="ignore") as src, out_path.open("wb", buffering=1 << 20) as f:
+        for table in iter_tables(src):
+            if count:
+                f.write(separator)
+            f.write(table.encode("utf-8"))
+            count += 1
 
-    print(f"Extracted {len(tables)} table(s) to {OUTPUT_FILE}")
+    print(f"Extracted {count} table(s) to {OUTPUT_FILE}")
 
 
 if __name__ == "__main__":
@@ -3,6 +3,22 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(scope="session")
+def stuff_text() -> str:
+    """The sample rulebook text, read once per test session."""
+    return (ROOT / "stuff.md").read_text()
+
+
+@pytest.fixture(scope="session")
+def auto_parsed_stuff(stuff_text: str) -> list:
+    """``auto_parse_book`` output for ``stuff.md``, parsed once per test session."""
+    from ttrpgtools.book_import import auto_parse_book
+
+    return auto_parse_book(stuff_text, source="Core")
@@ -4,15 +4,17 @@ import json
 from argparse import Namespace
 from pathlib import Path
 
-from ttrpgtools import cli
+import pytest
+
+from ttrpgtools import build, cli
 from ttrpgtools.book_import import auto_parse_book
+from ttrpgtools.library import load_library_jsonl
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
-def test_auto_parse_book_discovers_sections() -> None:
-    text = (ROOT / "stuff.md").read_text()
-    entries = auto_parse_book(text, source="Core")
+def test_auto_parse_book_discovers_sections(auto_parsed_stuff: list) -> None:
+    entries = auto_parsed_stuff
 
     assert len(entries) == 106
     talent_names = {entry.name for entry in entries if getattr(entry, "name", None)}
@@ -23,6 +25,21 @@ def test_auto_parse_book_discovers_sections() -> None:
     assert any(item.roll_min == 1 and item.roll_max == 1 for item in divinations)
 
 
+@pytest.mark.parametrize(
+    "inserted",
+    [["", ""], ["Table salt is rationed on the hive ships."]],
+    ids=["double-blank", "prose-starting-with-table"],
+)
+def test_auto_parse_book_keeps_whole_talent_table(stuff_text: str, auto_parsed_stuff: list, inserted: list) -> None:
+    lines = stuff_text.splitlines()
+    row = lines.index("Autosanguine — Heal 2 Damage/day, always Lightly Wounded.")
+    lines[row:row] = inserted
+
+    entries = auto_parse_book("\n".join(lines) + "\n", source="Core")
+
+    assert [entry.to_dict() for entry in entries] == [entry.to_dict() for entry in auto_parsed_stuff]
+
+
 def test_cli_import_book_writes_library(tmp_path) -> None:
     library_path = tmp_path / "library.json"
     args = Namespace(
@@ -30,12 +47,71 @@ def test_cli_import_book_writes_library(tmp_path) -> None:
         library=str(library_path),
         page=None,
         source="Core",
+        cache_dir=None,
     )
 
     cli.cmd_import_book(args)
 
-    data = json.loads(library_path.read_text())
+    data = json.loads(library_path.read_bytes())
     names = {item["name"] for item in data if "name" in item}
     assert len(data) == 106
     assert "Telepathy" in names
     assert any(item.get("type") == "divination" for item in data)
+
+
+def test_cli_build_library_parses_books_in_parallel(tmp_path) -> None:
+    library_path = tmp_path / "library.json"
+    args = Namespace(
+        input=[str(ROOT / "stuff.md"), str(ROOT / "stuff.md")],
+        library=str(library_path),
+        source="Core",
+        workers=2,
+        cache_dir=None,
+    )
+
+    cli.cmd_build_library(args)
+
+    data = json.loads(library_path.read_bytes())
+    assert len(data) == 212
+    assert data[:106] == data[106:]
+
+
+def test_cli_build_library_jsonl_accepts_later_imports(tmp_path) -> None:
+    library_path = tmp_path / "library.jsonl"
+    snippet = tmp_path / "talent.txt"
+    snippet.write_text("Talent Name Prerequisite Benefit\nTest Talent — Grants a bonus to something.\n")
+
+    cli.cmd_build_library(
+        Namespace(input=[str(ROOT / "stuff.md")], library=str(library_path), source="Core", workers=1, cache_dir=None)
+    )
+    cli.cmd_import_text(
+        Namespace(input=str(snippet), category="talents-table", library=str(library_path), page=None, source=None)
+    )
+
+    entries = load_library_jsonl(library_path)
+    assert len(entries) == 107
+    assert entries[-1]["name"] == "Test Talent"
+
+
+def test_cli_import_book_reuses_cached_parse(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / "cache"
+    args = Namespace(
+        input=str(ROOT / "stuff.md"),
+        library=str(tmp_path / "library.jsonl"),
+        page=None,
+        source="Core",
+        cache_dir=str(cache_dir),
+    )
+
+    cli.cmd_import_book(args)
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("book was parsed again")
+
+    monkeypatch.setattr(build, "auto_parse_book", fail)
+    cli.cmd_import_book(args)
+
+    lines = (tmp_path / "library.jsonl").read_text().splitlines()
+    assert len(lines) == 212
+    assert lines[:106] == lines[106:]
@@ -38,6 +38,27 @@ def test_import_text_appends_entries(tmp_path) -> None:
     assert data[0]["description"].startswith("Grants a bonus")
 
 
+def test_import_text_appends_to_jsonl_library(tmp_path) -> None:
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("Talent Name Prerequisite Benefit\nTest Talent — Grants a bonus to something.")
+    library_path = tmp_path / "library.jsonl"
+
+    args = Namespace(
+        input=str(input_path),
+        category="talents-table",
+        library=str(library_path),
+        page=None,
+        source="Core Rulebook",
+    )
+
+    cli.cmd_import_text(args)
+    cli.cmd_import_text(args)
+
+    lines = library_path.read_text().splitlines()
+    assert len(lines) == 2
+    assert all(json.loads(line)["name"] == "Test Talent" for line in lines)
+
+
 def test_import_text_reports_parse_error(tmp_path) -> None:
     input_path = tmp_path / "input.txt"
     input_path.write_text("not a table")
@@ -53,3 +74,4 @@ def test_import_text_reports_parse_error(tmp_path) -> None:
 
     with pytest.raises(SystemExit):
         cli.cmd_import_text(args)
+
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from ttrpgtools.library import append_entries_jsonl, load_library_jsonl, save_library
+
+
+def test_append_entries_jsonl_ends_an_unterminated_last_line(tmp_path) -> None:
+    library_path = tmp_path / "library.jsonl"
+    library_path.write_text(json.dumps({"name": "Old"}))
+
+    append_entries_jsonl([{"name": "New"}], library_path)
+
+    assert [entry["name"] for entry in load_library_jsonl(library_path)] == ["Old", "New"]
+
+
+def test_append_entries_jsonl_refuses_json_array_library(tmp_path) -> None:
+    library_path = tmp_path / "library.jsonl"
+    save_library([{"name": "Old"}], library_path)
+    before = library_path.read_bytes()
+
+    with pytest.raises(ValueError, match="JSON array"):
+        append_entries_jsonl([{"name": "New"}], library_path)
+
+    assert library_path.read_bytes() == before
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from ttrpgtools import models
-from ttrpgtools.storage import character_from_dict
+from ttrpgtools.storage import character_from_dict, load_characters, save_characters
 
 
 def make_career(name: str, advance: models.Advance) -> models.Career:
@@ -29,6 +29,33 @@ def test_repeatable_advance_respects_purchase_limit() -> None:
         character.purchase_advance("Sound Constitution")
 
 
+def test_has_advance_includes_purchases_passed_to_constructor() -> None:
+    advance = models.Advance("Sound Constitution", xp_cost=100, page=120)
+    purchase = models.AdvancePurchase(name="Sound Constitution", xp_cost=100, page=120)
+    character = models.Character(name="Cassia", career=make_career("Guardsman", advance), purchases=[purchase])
+
+    assert character.has_advance("sound constitution")
+    assert character.xp_spent == 100
+    with pytest.raises(models.PrerequisiteError):
+        character.purchase_advance("Sound Constitution")
+
+
+def test_direct_purchase_edits_are_reflected_immediately() -> None:
+    advance = models.Advance("Sound Constitution", xp_cost=100, page=120)
+    character = models.Character(name="Cassia", career=make_career("Guardsman", advance), xp_total=400)
+    character.purchase_advance("Sound Constitution")
+
+    character.purchases = []
+
+    assert not character.has_advance("Sound Constitution")
+    assert character.xp_spent == 0
+    character.purchase_advance("Sound Constitution")
+    character.purchases.pop()
+    assert character.xp_spent == 0
+    character.purchase_advance("Sound Constitution")
+    assert character.xp_spent == 100
+
+
 def test_character_from_dict_rejects_excess_repeat_purchases() -> None:
     advance = models.Advance(
         "Sound Constitution",
@@ -55,3 +82,18 @@ def test_character_from_dict_rejects_excess_repeat_purchases() -> None:
         assert "Sound Constitution" in str(excinfo.value)
     finally:
         models.CAREERS.pop(key, None)
+
+
+def test_save_and_load_characters_keep_order(tmp_path) -> None:
+    career = models.get_career("Soldier")
+    characters = [models.Character(name=f"Trooper {idx}", career=career, xp_total=100 * idx) for idx in range(5)]
+    characters[3].purchase_advance("Basic Training")
+    paths = [tmp_path / f"trooper_{idx}.json" for idx in range(5)]
+
+    save_characters(zip(characters, paths), workers=3)
+    loaded = load_characters(paths, workers=3)
+
+    assert loaded == characters
+    assert loaded[3].has_advance("Basic Training")
+    with pytest.raises(FileNotFoundError):
+        load_characters([paths[0], tmp_path / "missing.json"])
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# scripts/ is not a package, so load the script module from its path.
+_spec = importlib.util.spec_from_file_location("modify_character", ROOT / "scripts" / "modify_character.py")
+modify_character = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(modify_character)
+
+
+def test_remove_action_reports_each_removal_once() -> None:
+    data = {"actions": [{"name": "Foo"}, {"name": "Bar"}]}
+    args = modify_character.build_parser().parse_args(
+        ["sheet.json", "--remove-action", "Foo", "--remove-action", "foo", "--remove-action", "Baz"]
+    )
+
+    messages = modify_character.apply_changes(data, args)
+
+    assert data["actions"] == [{"name": "Bar"}]
+    assert messages == ["Action removed: Foo.", "No action named 'foo' found.", "No action named 'Baz' found."]
+
+
+def _write_sheets(directory: Path) -> None:
+    directory.mkdir()
+    for name in ("alpha", "beta"):
+        sheet = {"name": name, "xp": {"total": 100, "spent": 0}, "actions": []}
+        (directory / f"{name}.json").write_text(json.dumps(sheet))
+
+
+def test_batch_modifies_every_sheet_in_place(tmp_path) -> None:
+    sheets = tmp_path / "party"
+    _write_sheets(sheets)
+
+    modify_character.main([str(sheets), "--batch", "--set-xp-spent", "40"])
+
+    for name in ("alpha", "beta"):
+        data = json.loads((sheets / f"{name}.json").read_text())
+        assert data["xp"] == {"total": 100, "spent": 40, "available": 60}
+
+
+def test_batch_writes_to_output_directory(tmp_path) -> None:
+    sheets = tmp_path / "party"
+    _write_sheets(sheets)
+    output = tmp_path / "modified"
+
+    modify_character.main([str(sheets), "--batch", "--output", str(output), "--set-xp-total", "500"])
+
+    assert sorted(path.name for path in output.iterdir()) == ["alpha.json", "beta.json"]
+    assert json.loads((output / "beta.json").read_text())["xp"]["available"] == 500
+    # The originals are left untouched.
+    assert json.loads((sheets / "beta.json").read_text())["xp"] == {"total": 100, "spent": 0}
+
+
+def test_batch_rejects_output_file(tmp_path) -> None:
+    sheets = tmp_path / "party"
+    _write_sheets(sheets)
+    output = tmp_path / "existing.json"
+    output.write_text("{}")
+
+    with pytest.raises(SystemExit):
+        modify_character.main([str(sheets), "--batch", "--output", str(output)])
+    assert output.read_text() == "{}"
+
+
+def test_singular_and_plural_flags_merge_in_order() -> None:
+    args = modify_character.build_parser().parse_args(
+        [
+            "sheet.json",
+            "--set-skill",
+            "Dodge=+10",
+            "--set-skills",
+            "Awareness=Trained",
+            "Climb=+20",
+            "--add-actions",
+            "Aim|Half Action|Steady",
+            "--add-action",
+            "Run|Full Action|Move fast",
+            "--remove-actions",
+            "Foo",
+            "Bar",
+            "--remove-action",
+            "Baz",
+        ]
+    )
+
+    assert args.set_skill == ["Dodge=+10", "Awareness=Trained", "Climb=+20"]
+    assert args.add_action == ["Aim|Half Action|Steady", "Run|Full Action|Move fast"]
+    assert args.remove_action == ["Foo", "Bar", "Baz"]
+
+    defaults = modify_character.build_parser().parse_args(["sheet.json"])
+    assert (defaults.set_skill, defaults.add_action, defaults.remove_action) == ([], [], [])
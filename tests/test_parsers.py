@@ -8,9 +8,12 @@ from ttrpgtools.parsers import (
     AdvanceEntry,
     CharacteristicAdvanceEntry,
     DivinationResultEntry,
+    DivinationTable,
     ParseError,
     PsychicPowerEntry,
     TalentEntry,
+    TalentTableParser,
+    iter_divination_table,
     parse_advances_table,
     parse_characteristic_advances_table,
     parse_divination_table,
@@ -44,6 +47,20 @@ def test_parse_talent_table_extracts_rows() -> None:
     assert entries[-1].name == "Cleanse And Purify"
 
 
+def test_talent_table_parser_matches_whole_prefix_parses() -> None:
+    lines = section("Table 4–1: Talents\n", include_marker=True).splitlines()[:12]
+    parser = TalentTableParser(source="Core")
+    for count, line in enumerate(lines, start=1):
+        parser.feed(line)
+        try:
+            expected = parse_talent_table("\n".join(lines[:count]), source="Core")
+        except ParseError:
+            assert not parser.complete
+        else:
+            assert parser.complete
+            assert parser.entries == expected
+
+
 def test_parse_talent_prose_supports_multiline_names() -> None:
     prose_text = section("talents text: \n\n")
     entries = parse_talent_prose(prose_text)
@@ -68,6 +85,29 @@ def test_parse_divination_table_handles_ranges() -> None:
     assert "Weapon Skill" in last.effect
 
 
+def test_divination_table_resolves_rolls_within_ranges() -> None:
+    divination_text = section("Table 1–18: Imperial Divination\n", include_marker=True)
+    entries = parse_divination_table(divination_text)
+    table = DivinationTable(list(reversed(entries)))
+    assert table.resolve(1) is entries[0]
+    assert table.resolve(99) is entries[-1]
+    for entry in entries:
+        assert table.resolve(entry.roll_min) is entry
+        assert table.resolve(entry.roll_max) is entry
+    with pytest.raises(KeyError):
+        table.resolve(entries[-1].roll_max + 1)
+
+
+def test_iter_divination_table_yields_entries_before_the_end() -> None:
+    divination_text = section("Table 1–18: Imperial Divination\n", include_marker=True)
+    entries = iter_divination_table(divination_text)
+    first = next(entries)
+    assert (first.roll_min, first.roll_max) == (1, 1)
+    assert [first, *entries] == parse_divination_table(divination_text)
+    with pytest.raises(ParseError):
+        list(iter_divination_table("Table 1: Empty\nRoll Result"))
+
+
 def test_parse_characteristic_advances_table_produces_entries() -> None:
     table_text = section("Table 2-6: Guardsman Characteristic Advances\n", include_marker=True)
     entries = parse_characteristic_advances_table(table_text)
@@ -5,7 +5,9 @@ from .storage import (
     character_from_dict,
     character_to_dict,
     load_character,
+    load_characters,
     save_character,
+    save_characters,
 )
 
 __all__ = [
@@ -18,5 +20,7 @@ __all__ = [
     "character_from_dict",
     "character_to_dict",
     "load_character",
+    "load_characters",
     "save_character",
+    "save_characters",
 ]
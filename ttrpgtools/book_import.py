@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from itertools import accumulate
 from typing import Callable, Iterable, List, Sequence
 
 from .parsers import (
+    AdvancesTableParser,
+    IncrementalParser,
     ParseError,
+    TalentTableParser,
     parse_advances_table,
     parse_characteristic_advances_table,
     parse_divination_table,
@@ -19,136 +24,281 @@ from .parsers import (
 
 ParseFunc = Callable[..., List]
 
+_CHAR_SIMPLE_RE = re.compile(r"^characteristic\s+simple\b", re.IGNORECASE)
+_TABLE_CAREER_RE = re.compile(r"table\s+[\d-]+:\s+([a-z\s-]+?)\s+characteristic\s+advance", re.IGNORECASE)
+_TABLE_CAPTION_RE = re.compile(r"table\s+\d+\s*[-–—]\s*\d+\b", re.IGNORECASE)
+
+
+@dataclass
+class _BookLines:
+    """Per-line normalisations shared by every detector, computed once per book."""
+
+    stripped: list[str]
+    lowered: list[str]
+    # ``stripped[i].isupper()``: all-caps lines are candidate names/headings and
+    # are tested repeatedly by several look-behind/look-ahead scans.
+    upper: list[bool]
+    # The book re-joined with "\n" once, and where each line starts in it, so a
+    # window of lines is a single slice rather than a fresh list slice + join.
+    text: str
+    offsets: list[int]
+    # Indices of "Table X-Y: <Career> Characteristic Advances" headers, in order,
+    # and the career each one names. Advance tables search backwards for these
+    # from every start they are tried at, so they are matched once per book.
+    career_lines: list[int]
+    career_names: list[str]
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[str]) -> "_BookLines":
+        stripped = [line.strip() for line in lines]
+        lowered = [line.lower() for line in stripped]
+        career_lines: list[int] = []
+        career_names: list[str] = []
+        for idx, line in enumerate(lowered):
+            if not line.startswith("table"):
+                continue
+            match = _TABLE_CAREER_RE.match(stripped[idx])
+            if match:
+                career_lines.append(idx)
+                career_names.append(match.group(1).strip().title())
+        return cls(
+            stripped=stripped,
+            lowered=lowered,
+            upper=[line.isupper() for line in stripped],
+            text="\n".join(lines) + "\n",
+            offsets=list(accumulate((len(line) + 1 for line in lines), initial=0)),
+            career_lines=career_lines,
+            career_names=career_names,
+        )
+
+    def __len__(self) -> int:
+        return len(self.stripped)
+
+    def window(self, start: int, end: int) -> str:
+        """Return ``"\n".join(lines[start:end])`` without rebuilding it."""
+        return self.text[self.offsets[start] : self.offsets[end] - 1]
+
 
 @dataclass
 class _Detector:
     """Defines how to locate and parse a section within a book."""
 
     parser: ParseFunc
-    start_finder: Callable[[Sequence[str], int], int | None]
+    start_finder: Callable[[_BookLines, int], int | None]
     max_lines: int = 400
-
-
-def _find_previous_table_header(lines: Sequence[str], idx: int) -> int:
-    if idx > 0 and lines[idx - 1].strip().lower().startswith("table"):
+    # Smallest window worth handing to the parser.
+    min_lines: int = 3
+    # Optional "section has certainly ended" test for a line; windows are never
+    # grown past the first boundary line after the start.
+    boundary: Callable[[_BookLines, int], bool] | None = None
+    # Windows that parse form one contiguous run: once the parser has succeeded,
+    # a failure means every larger window fails too. Lets the window search
+    # gallop instead of trying every size.
+    monotone: bool = False
+    # Line-at-a-time form of ``parser``, called with the same keyword arguments;
+    # when set, every window size is checked in a single pass.
+    incremental: Callable[..., IncrementalParser] | None = None
+
+
+def _find_previous_table_header(book: _BookLines, idx: int) -> int:
+    if idx > 0 and book.lowered[idx - 1].startswith("table"):
         return idx - 1
     return idx
 
 
-def _starts_with_header(line: str, header: str) -> bool:
-    return line.strip().lower().startswith(header)
-
-
-def _talent_table_start(lines: Sequence[str], idx: int) -> int | None:
-    if _starts_with_header(lines[idx], "talent name"):
-        return _find_previous_table_header(lines, idx)
+def _talent_table_start(book: _BookLines, idx: int) -> int | None:
+    if book.lowered[idx].startswith("talent name"):
+        return _find_previous_table_header(book, idx)
     return None
 
 
-def _advances_table_start(lines: Sequence[str], idx: int) -> int | None:
-    if _starts_with_header(lines[idx], "advance cost type"):
-        return _find_previous_table_header(lines, idx)
+def _advances_table_start(book: _BookLines, idx: int) -> int | None:
+    if book.lowered[idx].startswith("advance cost type"):
+        return _find_previous_table_header(book, idx)
     return None
 
 
-def _characteristic_table_start(lines: Sequence[str], idx: int) -> int | None:
-    if re.match(r"^characteristic\s+simple\b", lines[idx].strip(), re.IGNORECASE):
-        return _find_previous_table_header(lines, idx)
+def _characteristic_table_start(book: _BookLines, idx: int) -> int | None:
+    if _CHAR_SIMPLE_RE.match(book.stripped[idx]):
+        return _find_previous_table_header(book, idx)
     return None
 
 
-def _divination_table_start(lines: Sequence[str], idx: int) -> int | None:
-    lowered = lines[idx].strip().lower()
+def _divination_table_start(book: _BookLines, idx: int) -> int | None:
+    lowered = book.lowered[idx]
     if lowered.startswith("table") and "divination" in lowered:
         return idx
     return None
 
 
-def _talent_prose_start(lines: Sequence[str], idx: int) -> int | None:
-    current = lines[idx].strip()
-    if not current or not current.isupper():
+def _talent_prose_start(book: _BookLines, idx: int) -> int | None:
+    if not book.upper[idx]:
         return None
     # Look ahead for a prerequisites stanza to avoid catching ordinary headings.
-    for look_ahead in range(idx + 1, min(idx + 6, len(lines))):
-        candidate = lines[look_ahead].strip()
+    for look_ahead in range(idx + 1, min(idx + 6, len(book))):
+        candidate = book.stripped[look_ahead]
         if not candidate:
             continue
-        lowered = candidate.lower()
+        lowered = book.lowered[look_ahead]
         if lowered.startswith("prerequisites:"):
             return idx
-        if any(lowered.startswith(prefix) for prefix in ["threshold:", "focus time:", "sustain:", "range:"]):
+        if lowered.startswith(("threshold:", "focus time:", "sustain:", "range:")):
             return None
-        if candidate.isupper():
+        if book.upper[look_ahead]:
             return None
         break
     return None
 
 
-def _psychic_power_start(lines: Sequence[str], idx: int) -> int | None:
-    current = lines[idx].strip()
-    if not current or not current.isupper():
+def _psychic_power_start(book: _BookLines, idx: int) -> int | None:
+    if not book.upper[idx]:
         return None
-    for look_ahead in range(idx + 1, min(idx + 8, len(lines))):
-        candidate = lines[look_ahead].strip().lower()
+    for look_ahead in range(idx + 1, min(idx + 8, len(book))):
+        candidate = book.lowered[look_ahead]
         if not candidate:
             continue
-        if any(candidate.startswith(prefix) for prefix in ["threshold:", "focus time:", "sustain:", "range:"]):
+        if candidate.startswith(("threshold:", "focus time:", "sustain:", "range:")):
             return idx
         if ":" in candidate:
             break
     return None
 
 
+def _table_boundary(book: _BookLines, idx: int) -> bool:
+    """A numbered table caption such as ``Table 4-1: Talents``, which starts the next table."""
+    return _TABLE_CAPTION_RE.match(book.stripped[idx]) is not None
+
+
+_TALENT_TABLE = _Detector(
+    parser=parse_talent_table,
+    start_finder=_talent_table_start,
+    max_lines=200,
+    boundary=_table_boundary,
+    incremental=TalentTableParser,
+)
+_TALENT_PROSE = _Detector(parser=parse_talent_prose, start_finder=_talent_prose_start, max_lines=200)
+_ADVANCES_TABLE = _Detector(
+    parser=parse_advances_table,
+    start_finder=_advances_table_start,
+    max_lines=120,
+    boundary=_table_boundary,
+    incremental=AdvancesTableParser,
+)
+_CHARACTERISTIC_TABLE = _Detector(
+    parser=parse_characteristic_advances_table,
+    start_finder=_characteristic_table_start,
+    max_lines=120,
+    monotone=True,
+)
+_DIVINATION_TABLE = _Detector(
+    parser=parse_divination_table,
+    start_finder=_divination_table_start,
+    max_lines=120,
+    monotone=True,
+)
+_PSYCHIC_POWERS = _Detector(parser=parse_psychic_powers, start_finder=_psychic_power_start, max_lines=200)
+
 _DETECTORS: list[_Detector] = [
-    _Detector(parser=parse_talent_table, start_finder=_talent_table_start, max_lines=200),
-    _Detector(parser=parse_talent_prose, start_finder=_talent_prose_start, max_lines=200),
-    _Detector(parser=parse_advances_table, start_finder=_advances_table_start, max_lines=120),
-    _Detector(
-        parser=parse_characteristic_advances_table,
-        start_finder=_characteristic_table_start,
-        max_lines=120,
-    ),
-    _Detector(parser=parse_divination_table, start_finder=_divination_table_start, max_lines=120),
-    _Detector(parser=parse_psychic_powers, start_finder=_psychic_power_start, max_lines=200),
+    _TALENT_TABLE,
+    _TALENT_PROSE,
+    _ADVANCES_TABLE,
+    _CHARACTERISTIC_TABLE,
+    _DIVINATION_TABLE,
+    _PSYCHIC_POWERS,
 ]
 
-
-def _next_detector_index(lines: Sequence[str], start: int, *, ignore: _Detector | None = None) -> int | None:
-    for idx in range(start + 1, len(lines)):
-        for detector in _DETECTORS:
-            if detector is ignore:
+# Detector results for one line, in ``_DETECTORS`` order: ``(detector, start)``.
+_Hits = List[tuple[_Detector, int]]
+
+# Every line a start finder can accept either is all caps (prose talents, psychic
+# powers) or, lower-cased, begins with a table header keyword.  The first five
+# characters of those keywords are distinct, so one dict lookup per line picks
+# the only detectors worth asking.
+_PREFIX_LENGTH = 5
+_PREFIX_DETECTORS: dict[str, tuple[_Detector, ...]] = {
+    "talen": (_TALENT_TABLE,),
+    "advan": (_ADVANCES_TABLE,),
+    "chara": (_CHARACTERISTIC_TABLE,),
+    "table": (_DIVINATION_TABLE,),
+}
+_UPPER_DETECTORS: tuple[_Detector, ...] = (_TALENT_PROSE, _PSYCHIC_POWERS)
+
+
+def _in_detector_order(*groups: tuple[_Detector, ...]) -> tuple[_Detector, ...]:
+    wanted = {id(detector) for group in groups for detector in group}
+    return tuple(detector for detector in _DETECTORS if id(detector) in wanted)
+
+
+# All-caps lines that also start with a header keyword need both groups, still in
+# ``_DETECTORS`` order.
+_UPPER_PREFIX_DETECTORS: dict[str, tuple[_Detector, ...]] = {
+    prefix: _in_detector_order(detectors, _UPPER_DETECTORS)
+    for prefix, detectors in _PREFIX_DETECTORS.items()
+}
+
+
+def _scan_detectors(book: _BookLines) -> tuple[list[int], list[_Hits]]:
+    """Run every start finder over the book once.
+
+    Returns the sorted indices of lines where at least one detector fires, and for
+    each of those lines the detectors that fired with the start they reported.
+    """
+
+    hit_lines: list[int] = []
+    hit_results: list[_Hits] = []
+    for idx, (lowered, upper) in enumerate(zip(book.lowered, book.upper)):
+        prefix = lowered[:_PREFIX_LENGTH]
+        if upper:
+            detectors = _UPPER_PREFIX_DETECTORS.get(prefix, _UPPER_DETECTORS)
+        else:
+            detectors = _PREFIX_DETECTORS.get(prefix)
+            if detectors is None:
                 continue
-            result = detector.start_finder(lines, idx)
-            if result is not None and result != start:
-                return idx
+        hits: _Hits = []
+        for detector in detectors:
+            start = detector.start_finder(book, idx)
+            if start is not None:
+                hits.append((detector, start))
+        if hits:
+            hit_lines.append(idx)
+            hit_results.append(hits)
+    return hit_lines, hit_results
+
+
+def _next_detector_index(
+    hit_lines: Sequence[int],
+    hit_results: Sequence[_Hits],
+    start: int,
+    *,
+    ignore: _Detector | None = None,
+) -> int | None:
+    for pos in range(bisect_right(hit_lines, start), len(hit_lines)):
+        for detector, result in hit_results[pos]:
+            if detector is not ignore and result != start:
+                return hit_lines[pos]
     return None
 
 
-def _extract_career_from_table_header(lines: Sequence[str], start: int) -> str | None:
+def _extract_career_from_table_header(book: _BookLines, start: int) -> str | None:
     """Extract career name from table headers like 'Table 2-2: Adept Characteristic Advances'."""
-    for i in range(max(0, start - 5), start + 3):
-        if i >= len(lines):
-            break
-        line = lines[i].strip()
-        # Match pattern: "Table X-Y: [Career Name] Characteristic Advance"
-        match = re.match(r"table\s+[\d-]+:\s+([a-z\s-]+?)\s+characteristic\s+advance", line, re.IGNORECASE)
-        if match:
-            return match.group(1).strip().title()
+    pos = bisect_left(book.career_lines, max(0, start - 5))
+    if pos < len(book.career_lines) and book.career_lines[pos] < start + 3:
+        return book.career_names[pos]
     return None
 
 
-def _extract_rank_from_context(lines: Sequence[str], start: int) -> str | None:
+def _extract_rank_from_context(book: _BookLines, start: int) -> str | None:
     """Extract rank name from section headers like 'ARCHIVIST\\nADVANCES'."""
     # Look backwards for a rank name (all caps line followed by ADVANCES)
     for i in range(start - 1, max(0, start - 20), -1):
-        line = lines[i].strip()
-        if not line:
+        if not book.upper[i]:
             continue
+        line = book.stripped[i]
         # Check if this is an all-caps word (potential rank name)
-        if line.isupper() and len(line) > 2 and line.isalpha():
+        if len(line) > 2 and line.isalpha():
             # Check if next non-empty line is "ADVANCES"
-            for j in range(i + 1, min(len(lines), i + 5)):
-                next_line = lines[j].strip()
+            for j in range(i + 1, min(len(book), i + 5)):
+                next_line = book.stripped[j]
                 if not next_line:
                     continue
                 if next_line.upper() == "ADVANCES":
@@ -160,12 +310,17 @@ def _extract_rank_from_context(lines: Sequence[str], start: int) -> str | None:
 def _try_parse_window(
     parser: ParseFunc,
     lines: Sequence[str],
+    book: _BookLines,
     start: int,
     *,
     stop: int,
     max_lines: int,
     page: int | None,
     source: str | None,
+    monotone: bool = False,
+    min_lines: int = 3,
+    boundary: Callable[[_BookLines, int], bool] | None = None,
+    incremental: Callable[..., IncrementalParser] | None = None,
 ) -> tuple[int, List] | None:
     """Return ``(end_index, entries)`` for the largest successful window before ``stop``."""
 
@@ -177,32 +332,113 @@ def _try_parse_window(
 
     # Extract career and rank context for advance tables
     if parser == parse_characteristic_advances_table:
-        career = _extract_career_from_table_header(lines, start)
+        career = _extract_career_from_table_header(book, start)
         if career:
             kwargs["career"] = career
     elif parser == parse_advances_table:
-        rank = _extract_rank_from_context(lines, start)
+        rank = _extract_rank_from_context(book, start)
         if rank:
             kwargs["rank"] = rank
         # For advances, also try to find career from a characteristic table earlier
         career = None
         for i in range(start - 1, max(0, start - 100), -1):
-            candidate_career = _extract_career_from_table_header(lines, i)
+            candidate_career = _extract_career_from_table_header(book, i)
             if candidate_career:
                 career = candidate_career
                 break
         if career:
             kwargs["career"] = career
 
-    last_success: tuple[int, List] | None = None
-    upper_bound = min(len(lines), stop, start + max_lines)
-    for end in range(start + 3, upper_bound + 1):
-        window = "\n".join(lines[start:end])
+    def attempt(end: int) -> List | None:
         try:
-            entries = parser(window, **kwargs)
+            return parser(book.window(start, end), **kwargs)
         except ParseError:
-            continue
-        last_success = (end, entries)
+            return None
+
+    upper_bound = min(len(lines), stop, start + max_lines)
+    if boundary is not None:
+        for idx in range(start + 1, upper_bound):
+            if boundary(book, idx):
+                upper_bound = idx
+                break
+    probe_start = start + min_lines
+    if incremental is not None:
+        return _longest_incremental_parse(incremental(**kwargs), lines, start, probe_start, upper_bound)
+    if monotone:
+        return _largest_success(attempt, probe_start, upper_bound)
+
+    # Successes may come and go as the window grows, but only the largest one is
+    # wanted: try windows from the top down and stop at the first that parses.
+    for end in range(upper_bound, probe_start - 1, -1):
+        entries = attempt(end)
+        if entries is not None:
+            return end, entries
+    return None
+
+
+def _longest_incremental_parse(
+    parser: IncrementalParser, lines: Sequence[str], start: int, low: int, high: int
+) -> tuple[int, List] | None:
+    """Find the largest ``end`` in ``[low, high]`` whose window ``parser`` accepts.
+
+    Feeds ``lines[start:high]`` once; the parser's state after each line is the
+    result of parsing the window ending there.
+    """
+
+    best: tuple[int, int] | None = None
+    try:
+        for end in range(start + 1, high + 1):
+            parser.feed(lines[end - 1])
+            if end >= low and parser.complete:
+                best = (end, len(parser.entries))
+    except ParseError:
+        # No window containing the offending line parses.
+        pass
+    if best is None:
+        return None
+    end, count = best
+    return end, parser.entries[:count]
+
+
+def _largest_success(
+    attempt: Callable[[int], List | None], low: int, high: int
+) -> tuple[int, List] | None:
+    """Find the largest ``end`` in ``[low, high]`` for which ``attempt`` succeeds.
+
+    Assumes successes form a single contiguous run, so after the first success the
+    end of the run is located by exponential probing followed by a binary search:
+    O(log n) parser calls instead of one per candidate window.
+    """
+
+    # Small windows usually fail until enough of the section is included.
+    for end in range(low, high + 1):
+        entries = attempt(end)
+        if entries is not None:
+            break
+    else:
+        return None
+    last_success = (end, entries)
+
+    # Gallop past the known success until a window fails (or the range ends).
+    failed = high + 1
+    step = 1
+    while last_success[0] < high:
+        probe = min(last_success[0] + step, high)
+        entries = attempt(probe)
+        if entries is None:
+            failed = probe
+            break
+        last_success = (probe, entries)
+        step *= 2
+
+    # The run ends somewhere between the last success and the first failure.
+    while failed - last_success[0] > 1:
+        probe = (last_success[0] + failed) // 2
+        entries = attempt(probe)
+        if entries is None:
+            failed = probe
+        else:
+            last_success = (probe, entries)
 
     return last_success
 
@@ -210,26 +446,34 @@ def _try_parse_window(
 def auto_parse_book(text: str, *, page: int | None = None, source: str | None = None) -> List:
     """Scan a whole-book text for known sections and parse them automatically."""
 
-    lines = [line.rstrip("\n") for line in text.splitlines()]
+    lines = text.splitlines()
+    book = _BookLines.from_lines(lines)
+    hit_lines, hit_results = _scan_detectors(book)
     collected: list = []
 
     idx = 0
-    while idx < len(lines):
-        line = lines[idx]
+    while True:
+        # Lines where no detector fires are skipped outright.
+        pos = bisect_left(hit_lines, idx)
+        if pos == len(hit_lines):
+            break
+        idx = hit_lines[pos]
         matched = False
-        for detector in _DETECTORS:
-            start = detector.start_finder(lines, idx)
-            if start is None:
-                continue
-            stop = _next_detector_index(lines, start, ignore=detector) or len(lines)
+        for detector, start in hit_results[pos]:
+            stop = _next_detector_index(hit_lines, hit_results, start, ignore=detector) or len(lines)
             result = _try_parse_window(
                 detector.parser,
                 lines,
+                book,
                 start,
                 stop=stop,
                 max_lines=detector.max_lines,
                 page=page,
                 source=source,
+                monotone=detector.monotone,
+                min_lines=detector.min_lines,
+                boundary=detector.boundary,
+                incremental=detector.incremental,
             )
             if result is None:
                 continue
@@ -245,4 +489,3 @@ def auto_parse_book(text: str, *, page: int | None = None, source: str | None =
         raise ParseError("No recognizable sections were found in the supplied text.")
 
     return collected
-
@@ -0,0 +1,114 @@
+"""Build reference libraries from whole-book texts.
+
+Parsing a whole book is slow, so ``parse_book_cached`` (and ``build_library``
+when given a ``cache_dir``) keeps each book's parsed entries as JSON keyed by a
+digest of the text, the entry metadata and the parser sources.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List
+
+from .book_import import auto_parse_book
+from .library import load_library, save_library, save_library_jsonl
+from .parsers import ParseError
+
+__all__ = ["parse_book_cached", "build_library"]
+
+
+@lru_cache(maxsize=None)
+def _parser_fingerprint() -> bytes:
+    """Digest of the book parsing sources, so editing them invalidates cached parses."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    package_dir = Path(__file__).parent
+    for name in ("book_import.py", "parsers.py"):
+        digest.update((package_dir / name).read_bytes())
+    return digest.digest()
+
+
+def _parse_cache_path(cache_dir: str | Path, text: str, page: int | None, source: str | None) -> Path:
+    digest = hashlib.blake2b(_parser_fingerprint(), digest_size=16)
+    digest.update(repr((page, source)).encode())
+    digest.update(text.encode())
+    return Path(cache_dir) / f"{digest.hexdigest()}.json"
+
+
+def parse_book_cached(
+    text: str,
+    *,
+    page: int | None = None,
+    source: str | None = None,
+    cache_dir: str | Path,
+) -> List[dict]:
+    """Return :func:`auto_parse_book` entries for ``text`` as dicts, reusing a parse cached in ``cache_dir``.
+
+    A cached result is only reused for the same text, ``page`` and ``source``
+    and unchanged parser sources; unreadable cache files are parsed again and
+    replaced. Books with no recognisable sections raise ``ParseError`` and are
+    not cached.
+    """
+
+    cache_path = _parse_cache_path(cache_dir, text, page, source)
+    if cache_path.exists():
+        try:
+            return load_library(cache_path)
+        except ValueError:
+            pass
+    entries = [entry.to_dict() for entry in auto_parse_book(text, page=page, source=source)]
+    # Write beside the final name and rename, so concurrent readers never see a partial file.
+    partial_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    save_library(entries, partial_path)
+    os.replace(partial_path, cache_path)
+    return entries
+
+
+def _parse_book_file(path: str | Path, source: str | None, cache_dir: str | Path | None = None) -> List[dict]:
+    """Parse one book file into plain dicts, so only dicts cross process boundaries."""
+
+    text = Path(path).read_text()
+    try:
+        if cache_dir is not None:
+            return parse_book_cached(text, source=source, cache_dir=cache_dir)
+        entries = auto_parse_book(text, source=source)
+    except ParseError as exc:
+        raise ParseError(f"{path}: {exc}") from exc
+    return [entry.to_dict() for entry in entries]
+
+
+def build_library(
+    paths: Iterable[str | Path],
+    path: str | Path,
+    *,
+    source: str | None = None,
+    workers: int | None = None,
+    cache_dir: str | Path | None = None,
+) -> int:
+    """Parse every book in ``paths`` and write all entries to the library at ``path``.
+
+    Books are parsed in parallel across ``workers`` processes (default: one per
+    CPU) and the library is written once at the end, replacing any existing file;
+    a ``.jsonl`` path is written as JSON Lines so it can be appended to later, as
+    the ``import-text`` and ``import-book`` commands do. With ``cache_dir``, books parsed before are read from there (see
+    :func:`parse_book_cached`). Returns the number of entries written.
+    """
+
+    paths = list(paths)
+    if workers == 1 or len(paths) < 2:
+        batches = [_parse_book_file(book, source, cache_dir) for book in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = list(
+                executor.map(_parse_book_file, paths, [source] * len(paths), [cache_dir] * len(paths))
+            )
+    entries = [entry for batch in batches for entry in batch]
+    if Path(path).suffix == ".jsonl":
+        save_library_jsonl(entries, path)
+    else:
+        save_library(entries, path)
+    return len(entries)
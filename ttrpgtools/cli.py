@@ -6,7 +6,12 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
 
 from .models import CAREERS, PrerequisiteError, Character, get_career
 from .book_import import auto_parse_book
@@ -19,20 +24,21 @@ from .parsers import (
     parse_talent_prose,
     parse_talent_table,
 )
-from .library import append_entries
+from .build import build_library, parse_book_cached
+from .library import append_entries, append_entries_jsonl
 from .storage import character_from_dict, character_to_dict, load_character, save_character
 
 
-def _career_list() -> str:
-    lines = []
+def _career_list_lines() -> Iterable[str]:
     for career in CAREERS.values():
-        lines.append(f"{career.name}")
+        yield career.name
         for advance in career.advances.values():
             prereqs = ", ".join(advance.prerequisites) or "None"
-            lines.append(
-                f"  - {advance.name} (XP {advance.xp_cost}, page {advance.page}, prerequisites: {prereqs})"
-            )
-    return "\n".join(lines)
+            yield f"  - {advance.name} (XP {advance.xp_cost}, page {advance.page}, prerequisites: {prereqs})"
+
+
+def _career_list() -> str:
+    return "\n".join(_career_list_lines())
 
 
 def _load_character_or_exit(path: str | Path):
@@ -80,8 +86,20 @@ def cmd_show(args: argparse.Namespace) -> None:
     print(character.to_summary())
 
 
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 def cmd_save(args: argparse.Namespace) -> None:
-    character_data = json.load(sys.stdin) if args.stdin else json.loads(Path(args.source).read_text())
+    character_data = _loads(sys.stdin.buffer.read() if args.stdin else Path(args.source).read_bytes())
     character = character_from_dict(character_data)
     _save_character_or_exit(character, args.file)
     print(f"Character saved to {args.file}.")
@@ -90,7 +108,7 @@ def cmd_save(args: argparse.Namespace) -> None:
 def cmd_load(args: argparse.Namespace) -> None:
     character = _load_character_or_exit(args.file)
     if args.json:
-        print(json.dumps(character_to_dict(character), indent=2))
+        print(_dumps(character_to_dict(character)))
     else:
         print(character.to_summary())
 
@@ -117,28 +135,50 @@ def _parse_import_category(category: str, text: str, page: int | None, source: s
     raise ValueError(f"Unknown import category: {category}")
 
 
+def _append_to_library(entries: list, library: str) -> None:
+    try:
+        if Path(library).suffix == ".jsonl":
+            append_entries_jsonl(entries, library)
+        else:
+            append_entries(entries, library)
+    except ValueError as exc:
+        raise SystemExit(f"Could not update library: {exc}") from exc
+
+
 def cmd_import_text(args: argparse.Namespace) -> None:
     text = Path(args.input).read_text()
     try:
         entries = _parse_import_category(args.category, text, args.page, args.source)
     except ParseError as exc:
         raise SystemExit(f"Could not parse input: {exc}") from exc
-    entry_payloads = [entry.to_dict() for entry in entries]
-    append_entries(entry_payloads, args.library)
-    print(f"Imported {len(entry_payloads)} entries into {args.library}.")
+    _append_to_library(entries, args.library)
+    print(f"Imported {len(entries)} entries into {args.library}.")
 
 
 def cmd_import_book(args: argparse.Namespace) -> None:
     text = Path(args.input).read_text()
     try:
-        entries = auto_parse_book(text, page=args.page, source=args.source)
+        if args.cache_dir is not None:
+            entries = parse_book_cached(text, page=args.page, source=args.source, cache_dir=args.cache_dir)
+        else:
+            entries = auto_parse_book(text, page=args.page, source=args.source)
     except ParseError as exc:
         raise SystemExit(f"Could not parse any sections: {exc}") from exc
 
-    append_entries([entry.to_dict() for entry in entries], args.library)
+    _append_to_library(entries, args.library)
     print(f"Imported {len(entries)} entries into {args.library}.")
 
 
+def cmd_build_library(args: argparse.Namespace) -> None:
+    try:
+        count = build_library(
+            args.input, args.library, source=args.source, workers=args.workers, cache_dir=args.cache_dir
+        )
+    except ParseError as exc:
+        raise SystemExit(f"Could not parse any sections: {exc}") from exc
+    print(f"Wrote {count} entries from {len(args.input)} books into {args.library}.")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Tools for managing TTRPG characters.")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -207,7 +247,7 @@ def build_parser() -> argparse.ArgumentParser:
     import_parser.add_argument(
         "--library",
         default="library.json",
-        help="Path to the JSON library that will be appended to",
+        help="Path to the JSON library that will be appended to (.jsonl appends without rewriting)",
     )
     import_parser.add_argument(
         "--page",
@@ -225,12 +265,31 @@ def build_parser() -> argparse.ArgumentParser:
     )
     book_parser.add_argument("--input", required=True, help="Path to the full book text file")
     book_parser.add_argument(
-        "--library", default="library.json", help="Path to the JSON library that will be appended to"
+        "--library",
+        default="library.json",
+        help="Path to the JSON library that will be appended to (.jsonl appends without rewriting)",
     )
     book_parser.add_argument("--page", type=int, help="Rulebook page number to record on each entry")
     book_parser.add_argument("--source", help="Source identifier or book title to record on each entry")
+    book_parser.add_argument("--cache-dir", help="Directory to reuse parse results from (default: parse every time)")
     book_parser.set_defaults(func=cmd_import_book)
 
+    build_library_parser = subparsers.add_parser(
+        "build-library", help="Parse several book texts in parallel and write them to a new library"
+    )
+    build_library_parser.add_argument("--input", required=True, nargs="+", help="Paths to the full book text files")
+    build_library_parser.add_argument(
+        "--library",
+        default="library.json",
+        help="Path to the JSON library to write, replaced if it exists (.jsonl writes one entry per line)",
+    )
+    build_library_parser.add_argument("--source", help="Source identifier or book title to record on each entry")
+    build_library_parser.add_argument("--workers", type=int, help="Number of worker processes (default: one per CPU)")
+    build_library_parser.add_argument(
+        "--cache-dir", help="Directory to reuse parse results from (default: parse every time)"
+    )
+    build_library_parser.set_defaults(func=cmd_build_library)
+
     return parser
 
 
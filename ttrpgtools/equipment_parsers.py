@@ -3,15 +3,74 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 from typing import List
 
+from .parsers import content_lines
+
+
+_RANGED_CLASSES = frozenset({"Pistol", "Basic", "Heavy", "Thrown"})
+
+# Whole-row weapon patterns mirroring the column rules of each table: the class
+# column is the first token that can be one, the weight is the last token ending
+# in "kg" and must be followed by a cost and an availability, and names, special
+# qualities and availability may span several tokens.
+_NOT_KG_TOKEN = r"(?!\S*kg(?!\S))\S+"
+_RANGED_CLASS = "|".join(sorted(_RANGED_CLASSES))
+_RANGED_ROW_RE = re.compile(
+    rf"""
+    \s*(?P<name>(?:(?!(?:{_RANGED_CLASS})\s)\S+\s+)+)
+    (?P<weapon_class>{_RANGED_CLASS})\s+
+    (?=(?:\S+\s+){{9}}\S)
+    (?P<range>\S+)\s+(?P<rof>\S+)\s+(?P<damage>\S+)\s+(?P<penetration>\S+)\s+
+    (?P<clip>\S+)\s+(?P<reload>\S+)\s+
+    (?:(?P<special>.*\S)\s+)?
+    (?P<weight>\S*kg)\s+
+    (?P<cost>{_NOT_KG_TOKEN})\s+
+    (?P<availability>{_NOT_KG_TOKEN}(?:\s+{_NOT_KG_TOKEN})*)\s*
+    """,
+    re.VERBOSE,
+).fullmatch
+_MELEE_ROW_RE = re.compile(
+    rf"""
+    \s*(?P<name>(?:(?!\S*(?i:melee)|Thrown\s)\S+\s+)+)
+    (?P<weapon_class>\S*(?i:melee)\S*|Thrown)\s+
+    (?=(?:\S+\s+){{6}}\S)
+    (?P<range>\S+)\s+(?P<damage>\S+)\s+(?P<penetration>\S+)\s+
+    (?:(?P<special>.*\S)\s+)?
+    (?P<weight>\S*kg)\s+
+    (?P<cost>{_NOT_KG_TOKEN})\s+
+    (?P<availability>{_NOT_KG_TOKEN}(?:\s+{_NOT_KG_TOKEN})*)\s*
+    """,
+    re.VERBOSE,
+).fullmatch
+
+
+def _is_weapon_header(line: str) -> bool:
+    lowered = line.lower()
+    return 'table' in lowered or lowered.startswith('name') or 'weapons' in lowered
+
+
+def _add_optional_fields(
+    payload: dict, page: int | None, source: str | None, full_description: str | None
+) -> dict:
+    """Add the optional trailing entry fields to ``payload``, leaving out unset ones."""
+
+    if page is not None:
+        payload["page"] = page
+    if source is not None:
+        payload["source"] = source
+    if full_description is not None:
+        payload["full_description"] = full_description
+    return payload
+
 
 class ParseError(ValueError):
     """Raised when equipment text cannot be parsed."""
 
 
-@dataclass
+@dataclass(slots=True)
 class RangedWeaponEntry:
     """Represents a ranged weapon."""
 
@@ -46,14 +105,11 @@ class RangedWeaponEntry:
             "weight": self.weight,
             "cost": self.cost,
             "availability": self.availability,
-            "page": self.page,
-            "source": self.source,
-            "full_description": self.full_description,
         }
-        return {k: v for k, v in payload.items() if v is not None}
+        return _add_optional_fields(payload, self.page, self.source, self.full_description)
 
 
-@dataclass
+@dataclass(slots=True)
 class MeleeWeaponEntry:
     """Represents a melee weapon."""
 
@@ -82,14 +138,11 @@ class MeleeWeaponEntry:
             "weight": self.weight,
             "cost": self.cost,
             "availability": self.availability,
-            "page": self.page,
-            "source": self.source,
-            "full_description": self.full_description,
         }
-        return {k: v for k, v in payload.items() if v is not None}
+        return _add_optional_fields(payload, self.page, self.source, self.full_description)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArmourEntry:
     """Represents armor."""
 
@@ -114,11 +167,8 @@ class ArmourEntry:
             "weight": self.weight,
             "cost": self.cost,
             "availability": self.availability,
-            "page": self.page,
-            "source": self.source,
-            "full_description": self.full_description,
         }
-        return {k: v for k, v in payload.items() if v is not None}
+        return _add_optional_fields(payload, self.page, self.source, self.full_description)
 
 
 def parse_ranged_weapons_table(
@@ -129,88 +179,42 @@ def parse_ranged_weapons_table(
 ) -> List[RangedWeaponEntry]:
     """Parse a ranged weapons table."""
 
-    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
     entries: list[RangedWeaponEntry] = []
     header_found = False
 
-    for line in lines:
-        lowered = line.lower()
+    for line in content_lines(text):
+        # Every row has a weight column, so once a header has been seen, lines
+        # without "kg" can be skipped without lower-casing them.
+        if header_found and 'kg' not in line:
+            continue
 
         # Skip table headers and category headers
-        if 'table' in lowered or lowered.startswith('name') or 'weapons' in lowered:
+        if _is_weapon_header(line):
             header_found = True
             continue
 
         if not header_found:
             continue
 
-        # Try to parse weapon row
         # Format: Name Class Range RoF Dam Pen Clip Rld Special Wt Cost Availability
-        tokens = line.split()
-        if len(tokens) < 11:
-            continue
-
-        # Name might be multiple words - find where class starts
-        # Class is usually: Pistol, Basic, Heavy, Thrown
-        class_idx = None
-        for i, tok in enumerate(tokens):
-            if tok in ['Pistol', 'Basic', 'Heavy', 'Thrown']:
-                class_idx = i
-                break
-
-        if class_idx is None or class_idx == 0:
-            continue
-
-        name = ' '.join(tokens[:class_idx])
-        weapon_class = tokens[class_idx]
-
-        # Parse rest of fields
-        remaining = tokens[class_idx + 1:]
-        if len(remaining) < 10:
+        row = _RANGED_ROW_RE(line)
+        if row is None:
             continue
 
-        range_val = remaining[0]
-        rof = remaining[1]
-        damage = remaining[2]
-        pen = remaining[3]
-        clip = remaining[4]
-        reload = remaining[5]
-
-        # Special qualities might be multiple words or "—"
-        # Find where weight starts (ends with 'kg')
-        wt_idx = None
-        for i in range(6, len(remaining)):
-            if 'kg' in remaining[i]:
-                wt_idx = i
-                break
-
-        if wt_idx is None:
-            continue
-
-        special = ' '.join(remaining[6:wt_idx]) if wt_idx > 6 else '—'
-        weight = remaining[wt_idx]
-
-        # Cost and availability are last two
-        if len(remaining) < wt_idx + 3:
-            continue
-
-        cost = remaining[wt_idx + 1]
-        availability = ' '.join(remaining[wt_idx + 2:])
-
         entries.append(
             RangedWeaponEntry(
-                name=name,
-                weapon_class=weapon_class,
-                range=range_val,
-                rof=rof,
-                damage=damage,
-                penetration=pen,
-                clip=clip,
-                reload=reload,
-                special=special,
-                weight=weight,
-                cost=cost,
-                availability=availability,
+                name=' '.join(row['name'].split()),
+                weapon_class=sys.intern(row['weapon_class']),
+                range=row['range'],
+                rof=row['rof'],
+                damage=row['damage'],
+                penetration=row['penetration'],
+                clip=row['clip'],
+                reload=row['reload'],
+                special=' '.join(row['special'].split()) if row['special'] else '—',
+                weight=row['weight'],
+                cost=row['cost'],
+                availability=sys.intern(' '.join(row['availability'].split())),
                 page=page,
                 source=source,
             )
@@ -229,15 +233,17 @@ def parse_melee_weapons_table(
 ) -> List[MeleeWeaponEntry]:
     """Parse a melee weapons table."""
 
-    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
     entries: list[MeleeWeaponEntry] = []
     header_found = False
 
-    for line in lines:
-        lowered = line.lower()
+    for line in content_lines(text):
+        # Every row has a weight column, so once a header has been seen, lines
+        # without "kg" can be skipped without lower-casing them.
+        if header_found and 'kg' not in line:
+            continue
 
         # Skip headers
-        if 'table' in lowered or lowered.startswith('name') or 'weapons' in lowered:
+        if _is_weapon_header(line):
             header_found = True
             continue
 
@@ -245,61 +251,21 @@ def parse_melee_weapons_table(
             continue
 
         # Format: Name Class Range Dam Pen Special Wt Cost Availability
-        tokens = line.split()
-        if len(tokens) < 8:
-            continue
-
-        # Find class (Melee, Melee/Thrown, Thrown)
-        class_idx = None
-        for i, tok in enumerate(tokens):
-            if 'melee' in tok.lower() or tok == 'Thrown':
-                class_idx = i
-                break
-
-        if class_idx is None or class_idx == 0:
-            continue
-
-        name = ' '.join(tokens[:class_idx])
-        weapon_class = tokens[class_idx]
-
-        remaining = tokens[class_idx + 1:]
-        if len(remaining) < 7:
+        row = _MELEE_ROW_RE(line)
+        if row is None:
             continue
 
-        range_val = remaining[0]
-        damage = remaining[1]
-        pen = remaining[2]
-
-        # Find weight (ends with 'kg')
-        wt_idx = None
-        for i in range(3, len(remaining)):
-            if 'kg' in remaining[i]:
-                wt_idx = i
-                break
-
-        if wt_idx is None:
-            continue
-
-        special = ' '.join(remaining[3:wt_idx]) if wt_idx > 3 else '—'
-        weight = remaining[wt_idx]
-
-        if len(remaining) < wt_idx + 3:
-            continue
-
-        cost = remaining[wt_idx + 1]
-        availability = ' '.join(remaining[wt_idx + 2:])
-
         entries.append(
             MeleeWeaponEntry(
-                name=name,
-                weapon_class=weapon_class,
-                range=range_val,
-                damage=damage,
-                penetration=pen,
-                special=special,
-                weight=weight,
-                cost=cost,
-                availability=availability,
+                name=' '.join(row['name'].split()),
+                weapon_class=sys.intern(row['weapon_class']),
+                range=row['range'],
+                damage=row['damage'],
+                penetration=row['penetration'],
+                special=' '.join(row['special'].split()) if row['special'] else '—',
+                weight=row['weight'],
+                cost=row['cost'],
+                availability=sys.intern(' '.join(row['availability'].split())),
                 page=page,
                 source=source,
             )
@@ -318,12 +284,11 @@ def parse_armour_table(
 ) -> List[ArmourEntry]:
     """Parse an armour table."""
 
-    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
     entries: list[ArmourEntry] = []
     header_found = False
     current_type = None
 
-    for line in lines:
+    for line in content_lines(text):
         lowered = line.lower()
 
         # Skip table header
@@ -355,7 +320,7 @@ def parse_armour_table(
             continue
 
         name = ' '.join(tokens[:ap_idx - 1])
-        locations = tokens[ap_idx - 1]
+        locations = sys.intern(tokens[ap_idx - 1])
         ap = tokens[ap_idx]
 
         remaining = tokens[ap_idx + 1:]
@@ -374,7 +339,7 @@ def parse_armour_table(
                 ap=ap,
                 weight=weight,
                 cost=cost,
-                availability=availability,
+                availability=sys.intern(availability),
                 page=page,
                 source=source,
             )
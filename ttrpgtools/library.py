@@ -1,12 +1,34 @@
-"""Simple JSON-backed data store for parsed reference material."""
+"""Simple JSON-backed data store for parsed reference material.
+
+Libraries are either one JSON array (``load_library``/``save_library``) or JSON
+Lines with one entry per line (``load_library_jsonl``/``append_entries_jsonl``).
+Appending to a JSON array rewrites the whole file; appending to JSON Lines only
+writes the new entries, so prefer ``.jsonl`` for libraries built up by repeated
+imports.
+"""
 
 from __future__ import annotations
 
 import json
+import mmap
+import os
 from pathlib import Path
-from typing import Iterable, List
+from typing import Any, BinaryIO, Iterable, Iterator, List
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
 
-__all__ = ["load_library", "save_library", "append_entries"]
+__all__ = [
+    "load_library",
+    "save_library",
+    "append_entries",
+    "load_library_jsonl",
+    "iter_library_jsonl",
+    "save_library_jsonl",
+    "append_entries_jsonl",
+]
 
 
 def load_library(path: str | Path) -> List[dict]:
@@ -15,25 +37,156 @@ def load_library(path: str | Path) -> List[dict]:
     file_path = Path(path)
     if not file_path.exists():
         return []
-    data = json.loads(file_path.read_text())
+    if orjson is not None:
+        data = _orjson_load_mapped(file_path)
+    else:
+        data = json.loads(file_path.read_text())
     if not isinstance(data, list):
         raise ValueError("Library JSON must be a list of entries.")
     return data
 
 
-def save_library(entries: Iterable[dict], path: str | Path) -> None:
-    """Persist ``entries`` to ``path`` in JSON format."""
+def _orjson_load_mapped(file_path: Path) -> Any:
+    """Decode ``file_path`` with orjson straight from a read-only memory map.
+
+    The file's bytes stay in the page cache instead of being copied into a
+    ``bytes`` object that lives alongside the decoded entries.
+    """
+
+    with file_path.open("rb") as handle:
+        if not file_path.stat().st_size:
+            # mmap cannot map an empty file; let orjson report the decode error.
+            return orjson.loads(b"")
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def _entry_to_dict(entry: Any) -> dict:
+    """``json`` fallback for parsed entry objects, converted only as they are encoded."""
+
+    to_dict = getattr(entry, "to_dict", None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(entry).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def save_library(entries: Iterable[Any], path: str | Path) -> None:
+    """Persist ``entries`` to ``path`` in JSON format.
+
+    ``entries`` may be plain dicts or parsed entries exposing ``to_dict()``.
+    """
 
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
     serialisable = list(entries)
-    file_path.write_text(json.dumps(serialisable, indent=2, sort_keys=True))
+    if orjson is not None:
+        # Dataclass entries are passed through to ``default`` so they are written
+        # via ``to_dict()`` rather than orjson's field-by-field encoding.
+        file_path.write_bytes(
+            orjson.dumps(
+                serialisable,
+                default=_entry_to_dict,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        )
+        return
+    # json.dump streams encoded chunks into the file buffer instead of building
+    # the whole document as one string first.
+    with file_path.open("w") as handle:
+        json.dump(serialisable, handle, indent=2, sort_keys=True, default=_entry_to_dict)
 
 
-def append_entries(entries: Iterable[dict], path: str | Path) -> List[dict]:
+def append_entries(entries: Iterable[Any], path: str | Path) -> List[Any]:
     """Append ``entries`` to the existing JSON library and return the updated list."""
 
     current = load_library(path)
     current.extend(entries)
     save_library(current, path)
     return current
+
+
+def load_library_jsonl(path: str | Path) -> List[dict]:
+    """Load a JSON Lines library from ``path`` if it exists, otherwise return an empty list."""
+
+    return list(iter_library_jsonl(path))
+
+
+def iter_library_jsonl(path: str | Path) -> Iterator[dict]:
+    """Yield the entries of the JSON Lines library at ``path`` one at a time.
+
+    Each line is decoded only when it is reached, so callers that stop early or
+    filter entries never hold the whole library in memory.
+    """
+
+    file_path = Path(path)
+    if not file_path.exists():
+        return
+    loads = orjson.loads if orjson is not None else json.loads
+    with file_path.open("rb") as handle:
+        for line in handle:
+            if line.strip():
+                yield loads(line)
+
+
+def _jsonl_line(entry: Any) -> bytes:
+    """Encode one entry as a newline-terminated JSON Lines record."""
+
+    if orjson is not None:
+        return orjson.dumps(
+            entry,
+            default=_entry_to_dict,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_APPEND_NEWLINE,
+        )
+    return json.dumps(entry, sort_keys=True, default=_entry_to_dict).encode() + b"\n"
+
+
+def _prepare_jsonl_append(handle: BinaryIO, file_path: Path) -> None:
+    """Check the JSON Lines file open in ``handle`` can be appended to.
+
+    A file that starts with ``[`` is a JSON array library, which appended lines
+    would corrupt, so it is refused. A last line without its newline is ended
+    first so the next record starts on a line of its own.
+    """
+
+    handle.seek(0)
+    while chunk := handle.read(4096):
+        content = chunk.lstrip()
+        if content:
+            if content.startswith(b"["):
+                raise ValueError(f"{file_path} holds a JSON array library, not JSON Lines.")
+            break
+    handle.seek(0, os.SEEK_END)
+    if handle.tell():
+        handle.seek(-1, os.SEEK_END)
+        if handle.read(1) != b"\n":
+            handle.write(b"\n")
+
+
+def _write_jsonl(entries: Iterable[Any], path: str | Path, *, append: bool) -> int:
+    file_path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    # "a+b" can read the existing tail while every write still lands at the end.
+    with file_path.open("a+b" if append else "wb") as handle:
+        if append:
+            _prepare_jsonl_append(handle, file_path)
+        for entry in entries:
+            handle.write(_jsonl_line(entry))
+            count += 1
+    return count
+
+
+def save_library_jsonl(entries: Iterable[Any], path: str | Path) -> int:
+    """Write ``entries`` to ``path`` as JSON Lines, replacing the file, and return how many were written."""
+
+    return _write_jsonl(entries, path, append=False)
+
+
+def append_entries_jsonl(entries: Iterable[Any], path: str | Path) -> int:
+    """Append ``entries`` to the JSON Lines library at ``path`` and return how many were written.
+
+    Existing entries are neither read nor rewritten. Raises ``ValueError`` if
+    ``path`` holds a JSON array library instead.
+    """
+
+    return _write_jsonl(entries, path, append=True)
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Sequence
+from typing import Container, Dict, Iterable, List, Sequence
 
 
 class PrerequisiteError(ValueError):
     """Raised when an advance cannot be purchased."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Advance:
     """Represents an advance available to a career."""
 
@@ -19,14 +19,26 @@ class Advance:
     page: int
     prerequisites: Sequence[str] = field(default_factory=tuple)
     max_purchases: int | None = 1
+    _prerequisites_lower: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so the lower-cased names used by every validation are set once here.
+        object.__setattr__(self, "_prerequisites_lower", tuple(name.lower() for name in self.prerequisites))
 
     def missing_prerequisites(self, owned_advances: Iterable[str]) -> List[str]:
         """Return prerequisites that are not in ``owned_advances``."""
-        owned_set = {name.lower() for name in owned_advances}
-        return [name for name in self.prerequisites if name.lower() not in owned_set]
+        return self._missing_from({name.lower() for name in owned_advances})
+
+    def _missing_from(self, owned_lower: Container[str]) -> List[str]:
+        """Like :meth:`missing_prerequisites` for already lower-cased advance names."""
+        return [
+            name
+            for name, lowered in zip(self.prerequisites, self._prerequisites_lower)
+            if lowered not in owned_lower
+        ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdvancePurchase:
     """Represents a purchased advance recorded on a character sheet."""
 
@@ -35,7 +47,7 @@ class AdvancePurchase:
     page: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Career:
     """A career that defines a list of advances."""
 
@@ -43,17 +55,17 @@ class Career:
     advances: Dict[str, Advance]
 
     def get_advance(self, advance_name: str) -> Advance:
-        try:
-            return self.advances[advance_name.lower()]
-        except KeyError as exc:
-            raise KeyError(f"Advance '{advance_name}' not found for career '{self.name}'.") from exc
+        advance = self.advances.get(advance_name.lower())
+        if advance is None:
+            raise KeyError(f"Advance '{advance_name}' not found for career '{self.name}'.")
+        return advance
 
     @classmethod
     def from_advances(cls, name: str, advances: Sequence[Advance]) -> "Career":
-        return cls(name=name, advances={adv.name.lower(): adv for adv in advances})
+        return cls(name, {adv.name.lower(): adv for adv in advances})
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """A character with XP accounting and advance purchases."""
 
@@ -62,11 +74,17 @@ class Character:
     xp_total: int = 0
     purchases: List[AdvancePurchase] = field(default_factory=list)
 
-    def has_advance(self, advance_name: str) -> bool:
-        return any(purchase.name.lower() == advance_name.lower() for purchase in self.purchases)
+    def _purchase_counts(self) -> Dict[str, int]:
+        """Lower-cased advance name -> times purchased, counted in one pass over ``purchases``."""
+        counts: Dict[str, int] = {}
+        for purchase in self.purchases:
+            key = purchase.name.lower()
+            counts[key] = counts.get(key, 0) + 1
+        return counts
 
-    def _purchase_count(self, advance: Advance) -> int:
-        return sum(1 for purchase in self.purchases if purchase.name.lower() == advance.name.lower())
+    def has_advance(self, advance_name: str) -> bool:
+        target = advance_name.lower()
+        return any(purchase.name.lower() == target for purchase in self.purchases)
 
     @property
     def xp_spent(self) -> int:
@@ -77,21 +95,22 @@ class Character:
         return self.xp_total - self.xp_spent
 
     def _validate_purchase(self, advance: Advance) -> None:
-        purchase_count = self._purchase_count(advance)
-        if advance.max_purchases is not None and purchase_count >= advance.max_purchases:
+        counts = self._purchase_counts()
+        if advance.max_purchases is not None and counts.get(advance.name.lower(), 0) >= advance.max_purchases:
             raise PrerequisiteError(
                 f"Advance '{advance.name}' can only be purchased {advance.max_purchases} times."
             )
 
-        missing = advance.missing_prerequisites(purchase.name for purchase in self.purchases)
+        missing = advance._missing_from(counts)
         if missing:
             raise PrerequisiteError(
                 "Missing prerequisites: " + ", ".join(missing)
             )
 
-        if advance.xp_cost > self.xp_available:
+        xp_available = self.xp_available
+        if advance.xp_cost > xp_available:
             raise PrerequisiteError(
-                f"Not enough XP. Cost: {advance.xp_cost}, available: {self.xp_available}."
+                f"Not enough XP. Cost: {advance.xp_cost}, available: {xp_available}."
             )
 
     def purchase_advance(self, advance_name: str, *, page_override: int | None = None) -> AdvancePurchase:
@@ -130,10 +149,10 @@ def register_career(career: Career) -> None:
 
 
 def get_career(name: str) -> Career:
-    try:
-        return CAREERS[name.lower()]
-    except KeyError as exc:
-        raise KeyError(f"Career '{name}' is not registered.") from exc
+    career = CAREERS.get(name.lower())
+    if career is None:
+        raise KeyError(f"Career '{name}' is not registered.")
+    return career
 
 
 # Built-in sample careers
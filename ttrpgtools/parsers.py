@@ -3,22 +3,34 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import Iterable, List, Sequence
+import string
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Protocol, Sequence
 
 __all__ = [
     "ParseError",
+    "content_lines",
     "TalentEntry",
     "AdvanceEntry",
     "CharacteristicAdvanceEntry",
     "DivinationResultEntry",
+    "DivinationTable",
     "PsychicPowerEntry",
+    "IncrementalParser",
+    "TalentTableParser",
+    "AdvancesTableParser",
     "parse_talent_table",
     "parse_talent_prose",
+    "iter_talent_prose",
     "parse_advances_table",
     "parse_characteristic_advances_table",
+    "iter_characteristic_advances_table",
     "parse_divination_table",
+    "iter_divination_table",
     "parse_psychic_powers",
+    "iter_psychic_powers",
 ]
 
 
@@ -26,7 +38,18 @@ class ParseError(ValueError):
     """Raised when a text snippet cannot be parsed into structured data."""
 
 
-@dataclass
+# Patterns used per row or per line are compiled once here rather than looked up
+# in the ``re`` module cache on every call.
+_DIGIT_PATTERN = re.compile(r"\d")
+_ASCII_DIGIT_PATTERN = re.compile(r"[0-9]")
+_COST_PATTERN = re.compile(r"[0-9][0-9,]*")
+_TALENT_HEADER_PATTERN = re.compile(r"talent\s+name")
+_ADVANCE_HEADER_PATTERN = re.compile(r"advance\s+cost\s+type")
+_DIVINATION_ROW_PATTERN = re.compile(r"^(?P<start>\d{1,2})(?:[–-](?P<end>\d{1,2}))?\s+(?P<text>.+)$")
+_QUOTE_PATTERN = re.compile(r"[\"“](.+?)[\"”]")
+
+
+@dataclass(slots=True)
 class TalentEntry:
     """Represents a talent definition."""
 
@@ -40,15 +63,18 @@ class TalentEntry:
         payload = {
             "type": "talent",
             "name": self.name,
-            "prerequisites": self.prerequisites,
-            "description": self.description,
-            "page": self.page,
-            "source": self.source,
         }
-        return {key: value for key, value in payload.items() if value is not None and value != []}
+        if self.prerequisites:
+            payload["prerequisites"] = self.prerequisites
+        payload["description"] = self.description
+        if self.page is not None:
+            payload["page"] = self.page
+        if self.source is not None:
+            payload["source"] = self.source
+        return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class AdvanceEntry:
     """Represents an advance (skill/talent purchase option)."""
 
@@ -67,16 +93,21 @@ class AdvanceEntry:
             "name": self.name,
             "cost": self.cost,
             "advance_type": self.advance_type,
-            "prerequisites": self.prerequisites,
-            "page": self.page,
-            "source": self.source,
-            "career": self.career,
-            "rank": self.rank,
         }
-        return {key: value for key, value in payload.items() if value is not None and value != []}
-
-
-@dataclass
+        if self.prerequisites:
+            payload["prerequisites"] = self.prerequisites
+        if self.page is not None:
+            payload["page"] = self.page
+        if self.source is not None:
+            payload["source"] = self.source
+        if self.career is not None:
+            payload["career"] = self.career
+        if self.rank is not None:
+            payload["rank"] = self.rank
+        return payload
+
+
+@dataclass(slots=True)
 class CharacteristicAdvanceEntry:
     """Represents XP costs for characteristic advances."""
 
@@ -93,14 +124,17 @@ class CharacteristicAdvanceEntry:
             "characteristic": self.characteristic,
             "tier": self.tier,
             "cost": self.cost,
-            "page": self.page,
-            "source": self.source,
-            "career": self.career,
         }
-        return {key: value for key, value in payload.items() if value is not None}
+        if self.page is not None:
+            payload["page"] = self.page
+        if self.source is not None:
+            payload["source"] = self.source
+        if self.career is not None:
+            payload["career"] = self.career
+        return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class DivinationResultEntry:
     """Represents a single divination table result."""
 
@@ -118,13 +152,35 @@ class DivinationResultEntry:
             "roll_max": self.roll_max,
             "quote": self.quote,
             "effect": self.effect,
-            "page": self.page,
-            "source": self.source,
         }
-        return {key: value for key, value in payload.items() if value is not None}
+        if self.page is not None:
+            payload["page"] = self.page
+        if self.source is not None:
+            payload["source"] = self.source
+        return payload
+
+
+@dataclass(slots=True)
+class DivinationTable:
+    """Divination results ordered by roll, for resolving rolls against a parsed table."""
+
+    entries: List[DivinationResultEntry]
+    # Upper bound of each entry's range, parallel to ``entries`` for bisecting.
+    _roll_max: List[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.entries = sorted(self.entries, key=lambda entry: entry.roll_max)
+        self._roll_max = [entry.roll_max for entry in self.entries]
 
+    def resolve(self, roll: int) -> DivinationResultEntry:
+        """Return the entry whose roll range contains ``roll``."""
+        idx = bisect_left(self._roll_max, roll)
+        if idx == len(self.entries) or self.entries[idx].roll_min > roll:
+            raise KeyError(f"No divination result for a roll of {roll}.")
+        return self.entries[idx]
 
-@dataclass
+
+@dataclass(slots=True)
 class CharacterModfierEntry:
     """Represents something that modifies a characters stats or another overriding attribute. 
     Examples are missing limbs, bionic augments, permanent effects of dark pacts."""
@@ -142,13 +198,15 @@ class CharacterModfierEntry:
             "value": self.value,
             "quote": self.quote,
             "effect": self.effect,
-            "page": self.page,
-            "source": self.source,
         }
-        return {key: value for key, value in payload.items() if value is not None}
+        if self.page is not None:
+            payload["page"] = self.page
+        if self.source is not None:
+            payload["source"] = self.source
+        return payload
 
 
-@dataclass
+@dataclass(slots=True)
 class PsychicPowerEntry:
     """Represents a psychic power definition."""
 
@@ -170,31 +228,46 @@ class PsychicPowerEntry:
             "sustain": self.sustain,
             "range": self.range,
             "description": self.description,
-            "page": self.page,
-            "source": self.source,
         }
-        return {key: value for key, value in payload.items() if value is not None}
+        if self.page is not None:
+            payload["page"] = self.page
+        if self.source is not None:
+            payload["source"] = self.source
+        return payload
+
+
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_NAME_LETTERS = _ASCII_LETTERS | {"'"}
+
+
+@lru_cache(maxsize=4096)
+def _normalise_name_token(token: str) -> str:
+    if len(token) <= 3 and token.isupper():
+        return token
+    # Preserve characters like † or punctuation by title-casing the first run of
+    # letters (and apostrophes) only.
+    size = len(token)
+    start = 0
+    while start < size and token[start] not in _ASCII_LETTERS:
+        start += 1
+    if start == size:
+        # Without letters an apostrophe is the only thing to title-case, which
+        # leaves the token as it is.
+        return token if "'" in token else token.capitalize()
+    end = start + 1
+    while end < size and token[end] in _NAME_LETTERS:
+        end += 1
+    return f"{token[:start]}{token[start:end].capitalize()}{token[end:]}"
 
 
 def _normalise_name(name_lines: Sequence[str]) -> str:
-    raw = " ".join(line.strip() for line in name_lines if line.strip())
-    tokens = raw.split()
-    normalised: list[str] = []
-    for token in tokens:
-        cleaned = token.strip()
-        if not cleaned:
-            continue
-        if cleaned.isupper() and len(cleaned) <= 3:
-            normalised.append(cleaned)
-        else:
-            # Preserve characters like † or punctuation by title-casing the alpha portion.
-            prefix = re.match(r"^([^A-Za-z]*)([A-Za-z\']+)(.*)$", cleaned)
-            if prefix:
-                lead, letters, trail = prefix.groups()
-                normalised.append(f"{lead}{letters.capitalize()}{trail}")
-            else:
-                normalised.append(cleaned.capitalize())
-    return " ".join(normalised)
+    return " ".join(_normalise_name_token(token) for line in name_lines for token in line.split())
+
+
+def content_lines(text: str) -> Iterator[str]:
+    """Yield the non-blank lines of ``text`` with trailing whitespace removed."""
+
+    return filter(None, map(str.rstrip, text.splitlines()))
 
 
 def _tokenize_table_row(row: str) -> list[str]:
@@ -204,116 +277,170 @@ def _tokenize_table_row(row: str) -> list[str]:
     return tokens
 
 
-def _score_talent_split(name_tokens: Sequence[str], prereq_tokens: Sequence[str], benefit_tokens: Sequence[str]) -> float:
-    if not name_tokens or not prereq_tokens or not benefit_tokens:
-        return float("-inf")
-
-    score = 0.0
-
-    if any(token.isdigit() for token in name_tokens):
-        score -= 3
-    if len(name_tokens) > 5:
-        score -= 1
-    if name_tokens[0][0].isupper():
-        score += 1
-    score += min(len(name_tokens), 4) * 0.3
-    if name_tokens[-1].lower() in {"basic", "weapon", "pistol", "sound", "thrown", "drive", "training"}:
-        score -= 1.5
-
-    prereq_text = " ".join(prereq_tokens)
-    if any(char.isdigit() for char in prereq_text):
-        score += 2
-    if "—" in prereq_text or "-" in prereq_text:
-        score += 1
-    if prereq_text.strip() == "—":
-        score += 3
-    lowered_prereq = prereq_text.lower()
-    if any(
-        keyword in lowered_prereq
-        for keyword in [
-            "training",
-            "talent",
-            "weapon",
-            "skill",
-            "bonus",
-            "frenzy",
-            "prerequisite",
-            "acrobatic",
-            "willpower",
-            "agility",
-            "perception",
-            "strength",
-            "fellowship",
-            "initiative",
-            "basic",
-            "pistol",
-            "thrown",
-            "drive",
-            "sound",
-            "constitution",
-            "fel",
-            "wp",
-            "bs",
-            "ws",
-            "per",
-            "int",
-            "toughness",
-        ]
-    ):
-        score += 1.5
-    if "(" in prereq_text and ")" in prereq_text:
-        score += 0.5
-    if len(prereq_tokens) > 8:
-        score -= 1
-    if len(prereq_tokens) == 1 and prereq_tokens[0].isdigit():
-        score -= 2
-    if len(prereq_tokens) == 1 and prereq_tokens[0] != "—":
-        score -= 1
-
-    benefit_text = " ".join(benefit_tokens)
-    if benefit_text.endswith("."):
-        score += 1.5
-    start_word = benefit_tokens[0].strip('"“”').lower()
-    if start_word in {"affect", "use", "on", "you", "heal", "gain", "re-roll", "reroll", "suffer", "remove", "reduce", "parry", "such", "whenever", "despite", "whenever", "burn!", "targets", "through", "whereas", "when"}:
-        score += 1
-    if any(char.isdigit() for char in benefit_text):
-        score += 0.5
-    if benefit_tokens[0].startswith("("):
-        score -= 2
-
-    return score
-
-
-def _split_talent_row(row: str) -> tuple[str, str, str]:
-    tokens = _tokenize_table_row(row)
-    best: tuple[str, str, str] | None = None
+def _clean_prerequisites(items: Iterable[str]) -> list[str]:
+    """Strip split prerequisite items, dropping empty ones and "—" placeholders."""
+
+    prerequisites: list[str] = []
+    for item in items:
+        item = item.strip()
+        if item and item != "—":
+            prerequisites.append(item.rstrip("."))
+    return prerequisites
+
+
+# Talent row scoring signals. Prerequisite keywords contain no spaces, so one
+# occurs in a run of tokens joined by spaces exactly when it occurs in one token.
+_NAME_TAIL_WORDS = frozenset({"basic", "weapon", "pistol", "sound", "thrown", "drive", "training"})
+_PREREQ_KEYWORDS = (
+    "training",
+    "talent",
+    "weapon",
+    "skill",
+    "bonus",
+    "frenzy",
+    "prerequisite",
+    "acrobatic",
+    "willpower",
+    "agility",
+    "perception",
+    "strength",
+    "fellowship",
+    "initiative",
+    "basic",
+    "pistol",
+    "thrown",
+    "drive",
+    "sound",
+    "constitution",
+    "fel",
+    "wp",
+    "bs",
+    "ws",
+    "per",
+    "int",
+    "toughness",
+)
+# One alternation tests every keyword in a single scan of the token.
+_PREREQ_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, _PREREQ_KEYWORDS)))
+_BENEFIT_START_WORDS = frozenset(
+    {"affect", "use", "on", "you", "heal", "gain", "re-roll", "reroll", "suffer", "remove", "reduce", "parry",
+     "such", "whenever", "despite", "burn!", "targets", "through", "whereas", "when"}
+)
+
+
+def _split_talent_row_tokens(tokens: Sequence[str]) -> tuple[str, str, str] | None:
+    """Split a talent row's tokens into name, prerequisites and benefit, or ``None`` if it is not one yet.
+
+    Every ``(name, prerequisites, benefit)`` split of the tokens is scored and
+    the best is kept. Rows are tried again with each continuation line, so
+    most failures are expected and are not worth an exception with a formatted
+    message.
+
+    The score of a split is a sum of terms that each depend on one part only, and
+    the prerequisite terms only test whether *any* token in the span has some
+    property. Those properties are computed once per token, so growing the span
+    by one token updates them in O(1) instead of re-joining and rescanning it.
+    Terms are added in a fixed order (name, prerequisites, benefit) so scores and
+    ties come out exactly as when each part's text was scored directly.
+    """
+    count = len(tokens)
+    lowered = [token.lower() for token in tokens]
+    # ``\d`` does not match every character str.isdigit() accepts (e.g. "²"), so
+    # only ASCII tokens, which are nearly all of them, take the regex shortcut.
+    find_digit = _ASCII_DIGIT_PATTERN.search
+    has_digit = [
+        find_digit(token) is not None if token.isascii() else any(char.isdigit() for char in token)
+        for token in tokens
+    ]
+    has_dash = ["—" in token or "-" in token for token in tokens]
+    find_keyword = _PREREQ_KEYWORD_PATTERN.search
+    has_keyword = [find_keyword(token) is not None for token in lowered]
+    has_open = ["(" in token for token in tokens]
+    has_close = [")" in token for token in tokens]
+
+    # Benefit terms depend only on where the benefit starts.
+    ends_with_period = tokens[-1].endswith(".")
+    benefit_start_word = [token.strip('"“”').lower() in _BENEFIT_START_WORDS for token in tokens]
+    benefit_opens_aside = [token.startswith("(") for token in tokens]
+    digit_from = [False] * (count + 1)
+    for idx in range(count - 1, -1, -1):
+        digit_from[idx] = has_digit[idx] or digit_from[idx + 1]
+
+    first_is_upper = tokens[0][0].isupper()
+    best: tuple[int, int] | None = None
     best_score = float("-inf")
+    name_has_number = False
+
+    for i in range(1, count - 1):
+        name_has_number = name_has_number or tokens[i - 1].isdigit()
+        name_score = 0.0
+        if name_has_number:
+            name_score -= 3
+        if i > 5:
+            name_score -= 1
+        if first_is_upper:
+            name_score += 1
+        name_score += min(i, 4) * 0.3
+        if lowered[i - 1] in _NAME_TAIL_WORDS:
+            name_score -= 1.5
+
+        first_prereq = tokens[i]
+        span_digit = span_dash = span_keyword = span_open = span_close = False
+        for j in range(i + 1, count):
+            last = j - 1
+            span_digit = span_digit or has_digit[last]
+            span_dash = span_dash or has_dash[last]
+            span_keyword = span_keyword or has_keyword[last]
+            span_open = span_open or has_open[last]
+            span_close = span_close or has_close[last]
+            single = j - i == 1
+
+            score = name_score
+            if span_digit:
+                score += 2
+            if span_dash:
+                score += 1
+            if single and first_prereq == "—":
+                score += 3
+            if span_keyword:
+                score += 1.5
+            if span_open and span_close:
+                score += 0.5
+            if j - i > 8:
+                score -= 1
+            if single and first_prereq.isdigit():
+                score -= 2
+            if single and first_prereq != "—":
+                score -= 1
+
+            if ends_with_period:
+                score += 1.5
+            if benefit_start_word[j]:
+                score += 1
+            if digit_from[j]:
+                score += 0.5
+            if benefit_opens_aside[j]:
+                score -= 2
 
-    for i in range(1, len(tokens) - 1):
-        for j in range(i + 1, len(tokens)):
-            name_tokens = tokens[:i]
-            prereq_tokens = tokens[i:j]
-            benefit_tokens = tokens[j:]
-            score = _score_talent_split(name_tokens, prereq_tokens, benefit_tokens)
             if score > best_score:
                 best_score = score
-                best = (
-                    " ".join(name_tokens),
-                    " ".join(prereq_tokens),
-                    " ".join(benefit_tokens),
-                )
+                best = (i, j)
+
     if best is None or best_score < 0:
-        raise ParseError(f"Could not parse talent table row: {row!r}")
-    name, prereq_text, benefit = best
+        return None
+    i, j = best
+    name = " ".join(tokens[:i])
+    prereq_text = " ".join(tokens[i:j])
+    benefit = " ".join(tokens[j:])
     lowered_prereq = prereq_text.lower()
     if not (
-        re.search(r"\d", prereq_text)
+        _DIGIT_PATTERN.search(prereq_text)
         or "—" in prereq_text
         or "talent" in lowered_prereq
         or "training" in lowered_prereq
         or "skill" in lowered_prereq
     ):
-        raise ParseError(f"Unable to identify prerequisites in row: {row!r}")
+        return None
     return name, prereq_text, benefit
 
 
@@ -321,7 +448,7 @@ def _split_advances_row(row: str) -> tuple[str, str, str, str]:
     tokens = _tokenize_table_row(row)
     cost_index = None
     for idx, token in enumerate(tokens):
-        if re.fullmatch(r"[0-9][0-9,]*", token):
+        if _COST_PATTERN.fullmatch(token):
             cost_index = idx
             break
     if cost_index is None or cost_index == 0 or cost_index >= len(tokens) - 2:
@@ -335,73 +462,120 @@ def _split_advances_row(row: str) -> tuple[str, str, str, str]:
     return name, cost, advance_type, prerequisites
 
 
-def parse_talent_table(text: str, *, page: int | None = None, source: str | None = None) -> List[TalentEntry]:
-    """Parse a compact talent table into :class:`TalentEntry` objects."""
+class IncrementalParser(Protocol):
+    """A parser that consumes a section one line at a time.
+
+    After every :meth:`feed`, :attr:`complete` reports whether the lines fed so
+    far would parse as a whole section, and :attr:`entries` holds what they
+    parsed to. Lets a caller find the longest parseable run of lines in one pass
+    instead of re-parsing every candidate window from scratch.
+    """
+
+    entries: list
+
+    def feed(self, line: str) -> None:
+        ...
+
+    @property
+    def complete(self) -> bool:
+        ...
 
-    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
-    entries: list[TalentEntry] = []
+    def finish(self) -> list:
+        ...
 
-    header_found = False
-    row_buffer: list[str] = []
-    for line in lines:
+
+class TalentTableParser:
+    """Line-at-a-time form of :func:`parse_talent_table`."""
+
+    def __init__(self, *, page: int | None = None, source: str | None = None) -> None:
+        self.page = page
+        self.source = source
+        self.entries: list[TalentEntry] = []
+        self._header_found = False
+        # Tokens of the row being assembled, so continuation lines extend it
+        # without re-joining and re-splitting the lines before them.
+        self._row_buffer: list[str] = []
+        self._ended = False
+
+    def feed(self, line: str) -> None:
+        line = line.rstrip()
+        if not line or self._ended:
+            return
         lowered = line.lower()
         if lowered.startswith("table"):
-            continue
-        if not header_found:
-            if re.match(r"talent\s+name", lowered):
-                header_found = True
-                continue
-            header_found = True
+            return
+        if not self._header_found:
+            self._header_found = True
+            if _TALENT_HEADER_PATTERN.match(lowered):
+                return
         if line.startswith("---"):
-            break
-        row_buffer.append(line)
-        candidate_row = " ".join(row_buffer)
-        try:
-            name, prereq_text, benefit = _split_talent_row(candidate_row)
-        except ParseError:
-            continue
-        row_buffer.clear()
-        prereqs = [item.strip().rstrip(".") for item in re.split(r",|;", prereq_text) if item.strip() and item.strip() != "—"]
-        entry = TalentEntry(
-            name=_normalise_name([name]),
-            prerequisites=prereqs,
-            description=benefit.strip(),
-            page=page,
-            source=source,
+            self._ended = True
+            return
+        self._row_buffer.extend(line.split())
+        split = _split_talent_row_tokens(self._row_buffer)
+        if split is None:
+            return
+        name, prereq_text, benefit = split
+        self._row_buffer.clear()
+        prereqs = _clean_prerequisites(prereq_text.replace(";", ",").split(","))
+        self.entries.append(
+            TalentEntry(
+                name=_normalise_name([name]),
+                prerequisites=prereqs,
+                description=benefit.strip(),
+                page=self.page,
+                source=self.source,
+            )
         )
-        entries.append(entry)
 
-    if row_buffer:
-        raise ParseError(f"Unparsed content remaining in talent table: {' '.join(row_buffer)!r}")
-    if not header_found or not entries:
-        raise ParseError("No talent entries were parsed from the provided text.")
-    return entries
+    @property
+    def complete(self) -> bool:
+        return self._header_found and bool(self.entries) and not self._row_buffer
 
+    def finish(self) -> List[TalentEntry]:
+        if self._row_buffer:
+            raise ParseError(f"Unparsed content remaining in talent table: {' '.join(self._row_buffer)!r}")
+        if not self._header_found or not self.entries:
+            raise ParseError("No talent entries were parsed from the provided text.")
+        return self.entries
+
+
+def parse_talent_table(text: str, *, page: int | None = None, source: str | None = None) -> List[TalentEntry]:
+    """Parse a compact talent table into :class:`TalentEntry` objects."""
+
+    parser = TalentTableParser(page=page, source=source)
+    for line in text.splitlines():
+        parser.feed(line)
+    return parser.finish()
 
-def parse_talent_prose(text: str, *, page: int | None = None, source: str | None = None) -> List[TalentEntry]:
-    """Parse an extended prose talent description section."""
 
-    lines = [line.rstrip() for line in text.splitlines()]
-    entries: list[TalentEntry] = []
+def iter_talent_prose(text: str, *, page: int | None = None, source: str | None = None) -> Iterator[TalentEntry]:
+    """Yield the talents of an extended prose description section as they are parsed."""
+
+    # Blank lines end some blocks, so they are kept (as empty strings).
+    lines = [line.strip() for line in text.splitlines()]
+    uppers = [line.isupper() for line in lines]
+    count = len(lines)
+    found = False
     idx = 0
 
-    while idx < len(lines):
-        if not lines[idx].strip():
+    while idx < count:
+        if not lines[idx]:
             idx += 1
             continue
-        if not lines[idx].strip().isupper():
+        if not uppers[idx]:
             raise ParseError(f"Expected talent name in uppercase, found: {lines[idx]!r}")
 
-        name_lines = [lines[idx].strip()]
+        name_lines = [lines[idx]]
         idx += 1
-        while idx < len(lines):
-            candidate = lines[idx].strip()
+        while idx < count:
+            candidate = lines[idx]
             if not candidate:
                 idx += 1
                 continue
             if candidate.startswith("Prerequisites:"):
                 break
-            if candidate.isupper():
+            if uppers[idx]:
                 name_lines.append(candidate)
                 idx += 1
                 continue
@@ -409,112 +583,146 @@ def parse_talent_prose(text: str, *, page: int | None = None, source: str | None
 
         name = _normalise_name(name_lines)
         prerequisites: list[str] = []
-        if idx < len(lines) and lines[idx].strip().startswith("Prerequisites:"):
-            prereq_buffer = lines[idx].strip()[len("Prerequisites:") :].strip()
+        if idx < count and lines[idx].startswith("Prerequisites:"):
+            prereq_buffer = lines[idx][len("Prerequisites:") :].strip()
             idx += 1
             if not prereq_buffer.endswith('.'):
-                while idx < len(lines):
-                    candidate = lines[idx].strip()
+                while idx < count:
+                    candidate = lines[idx]
                     if not candidate:
                         idx += 1
                         break
-                    if candidate.isupper() and not candidate.startswith("Prerequisites:"):
-                        break
-                    lowered = candidate.lower()
-                    if lowered.startswith(("talent groups:", "special:")):
-                        break
-                    if ":" in candidate:
+                    # Uppercase lines start the next talent; any "Label:" line,
+                    # such as Talent Groups: or Special:, starts the next field.
+                    if uppers[idx] or ":" in candidate:
                         break
                     prereq_buffer += " " + candidate
                     idx += 1
                     if candidate.endswith('.'):
                         break
-            prerequisites = [item.strip().rstrip(".") for item in prereq_buffer.split(",") if item.strip() and item.strip() != "—"]
+            prerequisites = _clean_prerequisites(prereq_buffer.split(","))
 
         description_lines: list[str] = []
-        while idx < len(lines):
-            candidate = lines[idx].strip()
+        while idx < count:
+            candidate = lines[idx]
             if not candidate:
                 idx += 1
                 continue
-            if candidate.isupper():
+            if uppers[idx]:
                 break
             description_lines.append(candidate)
             idx += 1
 
-        description = " ".join(description_lines).replace("  ", " ").strip()
-        entries.append(
-            TalentEntry(
-                name=name,
-                prerequisites=prerequisites,
-                description=description,
-                page=page,
-                source=source,
-            )
+        description = " ".join(description_lines).replace("  ", " ")
+        yield TalentEntry(
+            name=name,
+            prerequisites=prerequisites,
+            description=description,
+            page=page,
+            source=source,
         )
+        found = True
 
-    if not entries:
+    if not found:
         raise ParseError("No talents were discovered in the prose block.")
-    return entries
 
 
-def parse_advances_table(
-    text: str,
-    *,
-    page: int | None = None,
-    source: str | None = None,
-    career: str | None = None,
-    rank: str | None = None,
-) -> List[AdvanceEntry]:
-    """Parse a table of career advances."""
+def parse_talent_prose(text: str, *, page: int | None = None, source: str | None = None) -> List[TalentEntry]:
+    """Parse an extended prose talent description section."""
 
-    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
-    entries: list[AdvanceEntry] = []
-    header_found = False
-    for line in lines:
+    return list(iter_talent_prose(text, page=page, source=source))
+
+
+class AdvancesTableParser:
+    """Line-at-a-time form of :func:`parse_advances_table`.
+
+    :meth:`feed` raises :class:`ParseError` on a row that is not an advance; no
+    longer run of lines can parse after that.
+    """
+
+    def __init__(
+        self,
+        *,
+        page: int | None = None,
+        source: str | None = None,
+        career: str | None = None,
+        rank: str | None = None,
+    ) -> None:
+        self.page = page
+        self.source = source
+        self.career = career
+        self.rank = rank
+        self.entries: list[AdvanceEntry] = []
+        self._header_found = False
+        self._ended = False
+
+    def feed(self, line: str) -> None:
+        line = line.rstrip()
+        if not line or self._ended:
+            return
         lowered = line.lower()
         if lowered.startswith("table"):
-            continue
-        if not header_found:
-            if re.match(r"advance\s+cost\s+type", lowered):
-                header_found = True
-                continue
-            header_found = True
+            return
+        if not self._header_found:
+            self._header_found = True
+            if _ADVANCE_HEADER_PATTERN.match(lowered):
+                return
         if line.startswith("---"):
-            break
+            self._ended = True
+            return
         name, cost_text, advance_type, prereq_text = _split_advances_row(line)
-        prerequisites = [item.strip().rstrip(".") for item in re.split(r",|;", prereq_text) if item.strip() and item.strip() != "—"]
-        entries.append(
+        prerequisites = _clean_prerequisites(prereq_text.replace(";", ",").split(","))
+        self.entries.append(
             AdvanceEntry(
                 name=_normalise_name([name]),
                 cost=int(cost_text.replace(",", "")),
                 advance_type=advance_type,
                 prerequisites=prerequisites,
-                page=page,
-                source=source,
-                career=career,
-                rank=rank,
+                page=self.page,
+                source=self.source,
+                career=self.career,
+                rank=self.rank,
             )
         )
 
-    if not header_found or not entries:
-        raise ParseError("No advance entries were parsed from the provided text.")
-    return entries
+    @property
+    def complete(self) -> bool:
+        return self._header_found and bool(self.entries)
 
+    def finish(self) -> List[AdvanceEntry]:
+        if not self.complete:
+            raise ParseError("No advance entries were parsed from the provided text.")
+        return self.entries
 
-def parse_characteristic_advances_table(
+
+def parse_advances_table(
     text: str,
     *,
     page: int | None = None,
     source: str | None = None,
     career: str | None = None,
-) -> List[CharacteristicAdvanceEntry]:
-    """Parse a table of characteristic advance costs."""
+    rank: str | None = None,
+) -> List[AdvanceEntry]:
+    """Parse a table of career advances."""
+
+    parser = AdvancesTableParser(page=page, source=source, career=career, rank=rank)
+    for line in text.splitlines():
+        parser.feed(line)
+    return parser.finish()
+
 
-    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
-    entries: list[CharacteristicAdvanceEntry] = []
+def iter_characteristic_advances_table(
+    text: str,
+    *,
+    page: int | None = None,
+    source: str | None = None,
+    career: str | None = None,
+) -> Iterator[CharacteristicAdvanceEntry]:
+    """Yield characteristic advance costs from a table as they are parsed."""
+
+    found = False
     tiers: Sequence[str] | None = None
-    for line in lines:
+    for line in content_lines(text):
         lowered = line.lower()
         if lowered.startswith("table") or lowered.startswith("characteristic"):
             tokens = line.split()
@@ -543,49 +751,42 @@ def parse_characteristic_advances_table(
             # Remove commas from cost text
             cost_cleaned = cost_text.replace(",", "").strip()
             cost = int(cost_cleaned)
-            entries.append(
-                CharacteristicAdvanceEntry(
-                    characteristic=name,
-                    tier=_normalise_name([tier]),
-                    cost=cost,
-                    page=page,
-                    source=source,
-                    career=career,
-                )
+            yield CharacteristicAdvanceEntry(
+                characteristic=name,
+                tier=_normalise_name([tier]),
+                cost=cost,
+                page=page,
+                source=source,
+                career=career,
             )
+            found = True
 
-    if not entries:
+    if not found:
         raise ParseError("No characteristic advances found in the table.")
-    return entries
-
 
-_RANGE_PATTERN = re.compile(r"^(?P<start>\d{1,2})(?:[–-](?P<end>\d{1,2}))?$")
 
+def parse_characteristic_advances_table(
+    text: str,
+    *,
+    page: int | None = None,
+    source: str | None = None,
+    career: str | None = None,
+) -> List[CharacteristicAdvanceEntry]:
+    """Parse a table of characteristic advance costs."""
 
-def _parse_roll_range(token: str) -> tuple[int, int]:
-    match = _RANGE_PATTERN.match(token)
-    if not match:
-        raise ParseError(f"Invalid roll range token: {token!r}")
-    start = int(match.group("start"))
-    end = match.group("end")
-    return start, int(end) if end is not None else start
+    return list(iter_characteristic_advances_table(text, page=page, source=source, career=career))
 
 
-def parse_divination_table(
+def iter_divination_table(
     text: str, *, page: int | None = None, source: str | None = None
-) -> List[DivinationResultEntry]:
-    """Parse an Imperial Divination table."""
+) -> Iterator[DivinationResultEntry]:
+    """Yield the results of an Imperial Divination table as they are parsed."""
 
-    lines = [line.rstrip() for line in text.splitlines()]
-    entries: list[DivinationResultEntry] = []
     current_roll: tuple[int, int] | None = None
     current_text_parts: list[str] = []
     header_seen = False
 
-    for raw_line in lines:
-        line = raw_line.strip()
-        if not line:
-            continue
+    for line in filter(None, map(str.strip, text.splitlines())):
         lowered = line.lower()
         if lowered.startswith("table"):
             header_seen = True
@@ -594,23 +795,32 @@ def parse_divination_table(
             continue
         if lowered.startswith("roll"):
             continue
-        match = re.match(r"^(?P<range>\d{1,2}(?:[–-]\d{1,2})?)\s+(?P<text>.+)$", line)
+        match = _DIVINATION_ROW_PATTERN.match(line)
         if match:
             if current_roll is not None:
-                entries.append(_build_divination_entry(current_roll, " ".join(current_text_parts), page, source))
-            current_roll = _parse_roll_range(match.group("range"))
-            current_text_parts = [match.group("text").strip()]
+                yield _build_divination_entry(current_roll, " ".join(current_text_parts), page, source)
+            # The row pattern has already matched the roll range, so its bounds
+            # are read from the groups rather than parsed a second time.
+            start, end, roll_text = match.groups()
+            roll_min = int(start)
+            current_roll = (roll_min, int(end) if end is not None else roll_min)
+            current_text_parts = [roll_text.strip()]
             continue
         if current_roll is None:
             raise ParseError(f"Unexpected line in divination table: {line!r}")
         current_text_parts.append(line)
 
-    if current_roll is not None:
-        entries.append(_build_divination_entry(current_roll, " ".join(current_text_parts), page, source))
-
-    if not entries:
+    if current_roll is None:
         raise ParseError("No divination entries were parsed from the provided text.")
-    return entries
+    yield _build_divination_entry(current_roll, " ".join(current_text_parts), page, source)
+
+
+def parse_divination_table(
+    text: str, *, page: int | None = None, source: str | None = None
+) -> List[DivinationResultEntry]:
+    """Parse an Imperial Divination table."""
+
+    return list(iter_divination_table(text, page=page, source=source))
 
 
 def _build_divination_entry(
@@ -621,7 +831,7 @@ def _build_divination_entry(
 ) -> DivinationResultEntry:
     quote = text
     effect = ""
-    quote_match = re.search(r"[\"“](.+?)[\"”]", text)
+    quote_match = _QUOTE_PATTERN.search(text)
     if quote_match:
         quote = quote_match.group(1)
         effect = text[: quote_match.start()].strip() + text[quote_match.end() :].strip()
@@ -644,79 +854,91 @@ def _build_divination_entry(
     )
 
 
-def parse_psychic_powers(
-    text: str, *, page: int | None = None, source: str | None = None
-) -> List[PsychicPowerEntry]:
-    """Parse a sequence of psychic power descriptions."""
+# Lower-cased "Label:" of a psychic power line -> PsychicPowerEntry field it fills.
+_PSYCHIC_POWER_FIELDS = {
+    "threshold": "threshold",
+    "focus time": "focus_time",
+    "sustain": "sustain",
+    "range": "range",
+}
 
-    lines = [line.rstrip() for line in text.splitlines()]
-    entries: list[PsychicPowerEntry] = []
+
+def iter_psychic_powers(
+    text: str, *, page: int | None = None, source: str | None = None
+) -> Iterator[PsychicPowerEntry]:
+    """Yield psychic powers from a sequence of descriptions as they are parsed."""
+
+    # Blank lines end some blocks, so they are kept (as empty strings).
+    lines = [line.strip() for line in text.splitlines()]
+    uppers = [line.isupper() for line in lines]
+    count = len(lines)
+    found = False
     idx = 0
 
-    while idx < len(lines):
-        if not lines[idx].strip():
+    while idx < count:
+        if not lines[idx]:
             idx += 1
             continue
-        if not lines[idx].strip().isupper():
+        if not uppers[idx]:
             raise ParseError(f"Expected psychic power name in uppercase, found: {lines[idx]!r}")
-        name_lines = [lines[idx].strip()]
+        name_lines = [lines[idx]]
         idx += 1
-        while idx < len(lines):
-            candidate = lines[idx].strip()
+        while idx < count:
+            candidate = lines[idx]
             if not candidate:
                 idx += 1
                 continue
-            if candidate.isupper():
+            if uppers[idx]:
                 name_lines.append(candidate)
                 idx += 1
                 continue
             break
         name = _normalise_name(name_lines)
 
-        fields: dict[str, str] = {}
+        fields = {"focus_time": "", "sustain": "", "range": ""}
         description_lines: list[str] = []
-        while idx < len(lines):
-            candidate = lines[idx].strip()
+        while idx < count:
+            candidate = lines[idx]
             if not candidate:
                 idx += 1
                 continue
-            lowered = candidate.lower()
-            if candidate.isupper():
+            if uppers[idx]:
                 break
-            if ":" in candidate:
-                key, value = candidate.split(":", 1)
-                key_lower = key.strip().lower()
-                if key_lower in {"threshold", "focus time", "sustain", "range"}:
-                    fields[key_lower] = value.strip()
+            key, sep, value = candidate.partition(":")
+            if sep:
+                field_name = _PSYCHIC_POWER_FIELDS.get(key.strip().lower())
+                if field_name is not None:
+                    fields[field_name] = value.strip()
                     idx += 1
                     continue
             description_lines.append(candidate)
             idx += 1
 
         try:
-            threshold_value = int(fields["threshold"].split()[0])
+            threshold_value = int(fields.pop("threshold").split()[0])
         except (KeyError, ValueError, IndexError) as exc:
             raise ParseError(f"Missing or invalid threshold for psychic power '{name}'.") from exc
 
-        focus_time = fields.get("focus time", "")
-        sustain = fields.get("sustain", "")
-        range_ = fields.get("range", "")
-        description = " ".join(description_lines).replace("  ", " ").strip()
-        entries.append(
-            PsychicPowerEntry(
-                name=name,
-                threshold=threshold_value,
-                focus_time=focus_time,
-                sustain=sustain,
-                range=range_,
-                description=description,
-                page=page,
-                source=source,
-            )
+        description = " ".join(description_lines).replace("  ", " ")
+        yield PsychicPowerEntry(
+            name=name,
+            threshold=threshold_value,
+            description=description,
+            page=page,
+            source=source,
+            **fields,
         )
+        found = True
 
-    if not entries:
+    if not found:
         raise ParseError("No psychic powers were parsed from the provided text.")
-    return entries
+
+
+def parse_psychic_powers(
+    text: str, *, page: int | None = None, source: str | None = None
+) -> List[PsychicPowerEntry]:
+    """Parse a sequence of psychic power descriptions."""
+
+    return list(iter_psychic_powers(text, page=page, source=source))
 
 
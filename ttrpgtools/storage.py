@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 
 from .models import Career, Character, PrerequisiteError, get_career
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
 
 def character_to_dict(character: Character) -> Dict[str, Any]:
     return {
@@ -40,9 +46,44 @@ def character_from_dict(payload: Dict[str, Any]) -> Character:
 
 
 def save_character(character: Character, path: str | Path) -> None:
-    Path(path).write_text(json.dumps(character_to_dict(character), indent=2))
+    file_path = Path(path)
+    payload = character_to_dict(character)
+    if orjson is not None:
+        file_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    # Stream the encoded chunks into the file instead of building the document first.
+    with file_path.open("w") as handle:
+        json.dump(payload, handle, indent=2)
 
 
 def load_character(path: str | Path) -> Character:
-    data = json.loads(Path(path).read_text())
+    file_path = Path(path)
+    if orjson is not None:
+        data = orjson.loads(file_path.read_bytes())
+    else:
+        # json detects the encoding of the raw bytes, so skip decoding to str first.
+        with file_path.open("rb") as handle:
+            data = json.load(handle)
     return character_from_dict(data)
+
+
+def load_characters(paths: Iterable[str | Path], *, workers: int | None = None) -> List[Character]:
+    """Load every character file in ``paths``, returning them in the same order.
+
+    Files are read on a thread pool so their I/O overlaps; the first file that
+    fails to load raises its error.
+    """
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(load_character, paths))
+
+
+def save_characters(pairs: Iterable[Tuple[Character, str | Path]], *, workers: int | None = None) -> None:
+    """Save each ``(character, path)`` pair, writing the files on a thread pool."""
+
+    pairs = list(pairs)
+    characters = [character for character, _ in pairs]
+    paths = [path for _, path in pairs]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consuming the results re-raises the first failed save.
+        list(executor.map(save_character, characters, paths))